@@ -0,0 +1,190 @@
+import argparse
+import json
+import logging
+import random
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+from web3 import Web3, HTTPProvider
+from web3.middleware import geth_poa_middleware
+
+from contract.fee_contract import load_fee_contract
+from contract.kyc_contract import load_kyc_contract, create_request, approve_request, decline_request, \
+    withdraw_payments, decrease_kyc_level, get_request, \
+    submit_grant_kyc_centre_role, renounce_kyc_centre_role
+from utils import contract_registry
+from utils.account_pool import AccountPool
+from utils.account_util import ALPHA_KEY, CONTRACTS_ADMIN_KEY
+from utils.chain_params import ChainParameters
+from utils.http_session import pooled_session
+from utils.transaction_util import add_receipt_listener, remove_receipt_listener, wait_all
+
+logger = logging.getLogger()
+
+
+class RateLimiter:
+    def __init__(self, rate):
+        self.interval = 1.0 / rate if rate else 0.0
+        self._next = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        with self._lock:
+            slot = max(self._next, time.monotonic())
+            self._next = slot + self.interval
+        delay = slot - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+
+class Stats:
+    def __init__(self, selectors):
+        self.selectors = selectors
+        self.gas = defaultdict(list)
+        self.inclusion = defaultdict(list)
+        self.reverts = defaultdict(int)
+        self.errors = defaultdict(int)
+        self.lifecycles = 0
+        self.transactions = 0
+        self._lock = threading.Lock()
+
+    def on_receipt(self, pending, receipt):
+        operation = self.selectors.get(pending.selector, 'transfer' if pending.selector is None else pending.selector)
+        with self._lock:
+            self.transactions += 1
+            self.gas[operation].append(receipt['gasUsed'])
+            self.inclusion[operation].append(time.monotonic() - pending.submitted_at)
+            if receipt['status'] != 1:
+                self.reverts[operation] += 1
+
+    def error(self, operation, error):
+        logger.debug('{} failed: {}'.format(operation, error))
+        with self._lock:
+            self.errors[operation] += 1
+
+    def completed(self):
+        with self._lock:
+            self.lifecycles += 1
+
+    def report(self, elapsed):
+        return {
+            'elapsed_seconds': round(elapsed, 3),
+            'lifecycles': self.lifecycles,
+            'lifecycles_per_second': round(self.lifecycles / elapsed, 3),
+            'transactions_per_second': round(self.transactions / elapsed, 3),
+            'operations': {
+                operation: {
+                    'count': len(latencies),
+                    'mean_gas': round(sum(self.gas[operation]) / len(self.gas[operation])),
+                    'inclusion_p50_ms': _percentile(latencies, 0.50),
+                    'inclusion_p95_ms': _percentile(latencies, 0.95),
+                    'inclusion_p99_ms': _percentile(latencies, 0.99),
+                    'reverts': self.reverts[operation],
+                    'errors': self.errors[operation],
+                }
+                for operation, latencies in sorted(self.inclusion.items())
+            },
+            'failed_operations': dict(self.errors),
+        }
+
+
+def run(args):
+    web3 = Web3(HTTPProvider(args.node, request_kwargs={'timeout': 30},
+                             session=pooled_session(pool_size=args.users + args.centres)))
+    chain_params = ChainParameters()
+    web3.middleware_onion.inject(geth_poa_middleware, layer=0)
+    web3.middleware_onion.inject(chain_params.middleware, name='chain_params', layer=0)
+    add_receipt_listener(chain_params.observe_receipt)
+    load_fee_contract(web3)
+    load_kyc_contract(web3)
+    alpha = web3.eth.account.privateKeyToAccount(ALPHA_KEY)
+    admin = web3.eth.account.privateKeyToAccount(CONTRACTS_ADMIN_KEY)
+
+    logger.info('minting {} users and {} KYC centres'.format(args.users, args.centres))
+    pool = AccountPool(web3, alpha, size=args.users + args.centres)
+    users = [pool.acquire() for _ in range(args.users)]
+    centres = {centre.address: centre for centre in (pool.acquire() for _ in range(args.centres))}
+    wait_all(web3, [submit_grant_kyc_centre_role(web3, centre, admin) for centre in centres.values()])
+
+    stats = Stats({
+        selector: name for name, selector in contract_registry.artifact('KYCContract').selectors.items()
+    })
+    limiter = RateLimiter(args.rate)
+    deadline = time.monotonic() + args.duration
+    add_receipt_listener(stats.on_receipt)
+    started = time.monotonic()
+    try:
+        with ThreadPoolExecutor(max_workers=args.users) as executor:
+            for future in [executor.submit(_drive_user, web3, user, pool, centres, args, limiter, deadline, stats)
+                           for user in users]:
+                future.result()
+    finally:
+        elapsed = time.monotonic() - started
+        remove_receipt_listener(stats.on_receipt)
+        for centre in centres.values():
+            renounce_kyc_centre_role(web3, centre)
+    return stats.report(elapsed)
+
+
+def _drive_user(web3, user, pool, centres, args, limiter, deadline, stats):
+    while time.monotonic() < deadline:
+        limiter.acquire()
+        try:
+            index = create_request(web3, user, 1)
+        except Exception as error:
+            stats.error('createKYCRequest', error)
+            continue
+        try:
+            centre = centres.get(get_request(index)['centre'])
+        except Exception as error:
+            stats.error('kycRequests', error)
+            user = pool.acquire()
+            continue
+        if centre is None:
+            # the request stays pending on a centre the benchmark can't sign for, so the user can't request again
+            stats.error('foreign centre', 'request {} assigned to a centre outside the benchmark'.format(index))
+            user = pool.acquire()
+            continue
+        try:
+            if random.random() < args.approve_ratio:
+                approve_request(web3, index, centre)
+                decrease_kyc_level(web3, user.address, 0, centre)
+            else:
+                decline_request(web3, index, centre)
+            withdraw_payments(web3, user)
+        except Exception as error:
+            # a pending request or a level left at 1 would make every later createKYCRequest of this user fail
+            stats.error('decision', error)
+            user = pool.acquire()
+            continue
+        stats.completed()
+
+
+def _percentile(values, fraction):
+    ordered = sorted(values)
+    return round(ordered[min(int(fraction * len(ordered)), len(ordered) - 1)] * 1000, 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='KYC request lifecycle load generator')
+    parser.add_argument('--node', default='http://localhost:8575')
+    parser.add_argument('--users', type=int, default=10)
+    parser.add_argument('--centres', type=int, default=2)
+    parser.add_argument('--rate', type=float, default=5.0, help='target lifecycles started per second (0 = unlimited)')
+    parser.add_argument('--duration', type=float, default=60.0, help='seconds to keep starting new lifecycles')
+    parser.add_argument('--approve-ratio', type=float, default=0.5, help='share of requests approved, not declined')
+    parser.add_argument('--json', help='also write the report to this file')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(message)s')
+    report = run(args)
+    print(json.dumps(report, indent=2))
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -6,14 +6,63 @@ pytest_plugins = [
     'contract.filter_contract',
     'tests.context',
     'tests.genesis_account',
-    'utils.account_util'
+    'tests.parallel',
+    'tests.snapshot',
+    'utils.account_util',
+    'utils.rpc_metrics',
+    'utils.rpc_cassette',
+    'utils.gas_tracker'
 ]
 
 
 def pytest_addoption(parser):
-    parser.addoption('--node', default='http://localhost:8575')
+    parser.addoption('--node', default='http://localhost:8575',
+                     help='node RPC URL; ws:// or wss:// waits for receipts on newHeads notifications')
+    parser.addoption('--node-pool-size', type=int, default=32,
+                     help='maximum number of keep-alive HTTP connections to the node')
+    parser.addoption('--node-timeout', type=float, default=10,
+                     help='timeout in seconds for a single request to the node')
+    parser.addoption('--node-retries', type=int, default=3,
+                     help='retries with backoff on connection errors and 502/503/504 responses from the node')
+    parser.addoption('--backend', choices=('node', 'local'), default='node',
+                     help="'local' runs against an in-process eth-tester chain instead of --node")
+    parser.addoption('--gas-baseline', default='gas-baseline.json',
+                     help='file with the median gasUsed per contract function to compare against')
+    parser.addoption('--gas-tolerance', type=float, default=0.1,
+                     help='allowed relative gasUsed increase over the baseline')
+    parser.addoption('--gas-regression', choices=('warn', 'fail'), default='warn',
+                     help='warn or fail the run when gasUsed exceeds the baseline tolerance')
+    parser.addoption('--gas-update-baseline', action='store_true',
+                     help='write the gasUsed measured in this run to the baseline file')
+    parser.addoption('--snapshots', choices=('auto', 'off'), default='auto',
+                     help="revert chain state after every test when the backend supports evm_snapshot")
+    parser.addoption('--gas-price-refresh', default='block',
+                     help="refresh cached gas price on every new block ('block') or after N seconds")
+    parser.addoption('--call-cache-ttl', type=float, default=1.0,
+                     help='seconds an eth_call result at the latest known block may be reused; 0 disables the cache')
+    parser.addoption('--account-pool-size', type=int, default=16,
+                     help='number of funded and activated accounts minted per pool refill')
+    parser.addoption('--account-pool-refill', type=int, default=0,
+                     help='refill the account pool when it holds this many accounts or fewer')
+    parser.addoption('--worker-funds', type=float, default=100,
+                     help='ether sent from alpha_account to each pytest-xdist worker funding account')
+    parser.addoption('--account-mnemonic', default=None,
+                     help='mnemonic test accounts are derived from; a random one is generated and printed if unset')
+    parser.addoption('--rpc-record', metavar='DIR', default=None,
+                     help='record every JSON-RPC request and response into a cassette per test in DIR')
+    parser.addoption('--rpc-replay', metavar='DIR', default=None,
+                     help='answer JSON-RPC requests from the cassettes in DIR instead of a node')
 
 
 @pytest.fixture(scope='session', autouse=True)
 def node(request):
     return request.config.getoption("--node")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption('--backend') != 'local':
+        return
+    skip = pytest.mark.skip(reason='relies on transaction rules enforced by the node, not by the contracts')
+    for item in items:
+        if item.get_closest_marker('node_rules'):
+            item.add_marker(skip)
@@ -0,0 +1,21 @@
+from eth_account.signers.local import LocalAccount
+from web3 import Web3
+from web3.contract import Contract
+
+from utils import contract_registry
+from utils.async_transaction_util import submit_transaction, wait_all, build_transaction, call
+
+_contract: Contract = contract_registry.offline_contract('FeeContract')
+
+
+async def activate_account(web3: Web3, account: LocalAccount):
+    await wait_all(web3, [await submit_activation(web3, account)])
+
+
+async def submit_activation(web3: Web3, account: LocalAccount):
+    is_active = await call(web3, _contract, 'paidFee', [account.address])
+    if is_active:
+        return None
+    fee = await call(web3, _contract, 'initialFee')
+    tx = build_transaction(_contract, 'pay', sender=account, value=fee)
+    return await submit_transaction(web3, tx, account)
@@ -0,0 +1,65 @@
+from eth_account.signers.local import LocalAccount
+from web3.constants import HASH_ZERO
+from web3.contract import Contract
+
+from contract.kyc_contract import KYCCentreRole, get_level_price, convert_kyc_request, created_request_index
+from utils import contract_registry
+from utils.async_transaction_util import transact, submit_transaction, wait_all, build_transaction, call
+
+_contract: Contract = contract_registry.offline_contract('KYCContract')
+
+
+async def grant_kyc_centre_role(web3, beneficiary, admin):
+    await wait_all(web3, [await submit_grant_kyc_centre_role(web3, beneficiary, admin)])
+
+
+async def submit_grant_kyc_centre_role(web3, beneficiary, admin):
+    if await has_kyc_centre_role(web3, beneficiary):
+        return None
+
+    tx = build_transaction(_contract, 'grantRole', [KYCCentreRole, beneficiary.address], sender=admin)
+    return await submit_transaction(web3, tx, admin)
+
+
+async def renounce_kyc_centre_role(web3, account):
+    tx = build_transaction(_contract, 'renounceRole', [KYCCentreRole, account.address], sender=account)
+    await transact(web3, tx, account)
+
+
+async def has_kyc_centre_role(web3, account: LocalAccount) -> bool:
+    return await call(web3, _contract, 'hasRole', [KYCCentreRole, account.address])
+
+
+async def create_request(web3, requester, level=1):
+    tx = build_transaction(_contract, 'createKYCRequest', [level, HASH_ZERO], sender=requester,
+                           value=get_level_price(level))
+    return created_request_index(web3, await transact(web3, tx, requester))
+
+
+async def approve_request(web3, request_index, centre):
+    tx = build_transaction(_contract, 'approveKYCRequest', [request_index], sender=centre)
+    await transact(web3, tx, centre)
+
+
+async def decline_request(web3, request_index, centre):
+    tx = build_transaction(_contract, 'declineRequest', [request_index], sender=centre)
+    await transact(web3, tx, centre)
+
+
+async def withdraw_request(web3, account):
+    tx = build_transaction(_contract, 'repairLostRequest', sender=account)
+    await transact(web3, tx, account)
+
+
+async def withdraw_payments(web3, account, payee=None):
+    tx = build_transaction(_contract, 'withdrawPayments', [(payee or account).address], sender=account)
+    await transact(web3, tx, account)
+
+
+async def get_user_request(web3, address, index=0):
+    request = await call(web3, _contract, 'viewMyRequest', [index], address=address)
+    return convert_kyc_request(request)
+
+
+async def get_payments(web3, address):
+    return await call(web3, _contract, 'payments', [address])
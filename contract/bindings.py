@@ -0,0 +1,323 @@
+# Generated by tools/generate_bindings.py from artifacts/*.abi, do not edit.
+from dataclasses import dataclass
+from typing import Tuple
+
+from eth_abi import encode_abi, decode_abi
+from eth_utils import to_checksum_address
+
+
+@dataclass
+class KYCRequest:
+    __slots__ = ('user', 'data', 'level', 'status', 'centre', 'deposit')
+    user: str
+    data: bytes
+    level: int
+    status: int
+    centre: str
+    deposit: int
+
+    @classmethod
+    def from_tuple(cls, values) -> 'KYCRequest':
+        return cls(
+            user=to_checksum_address(values[0]),
+            data=values[1],
+            level=values[2],
+            status=values[3],
+            centre=to_checksum_address(values[4]),
+            deposit=values[5],
+        )
+
+    def __getitem__(self, key):
+        return getattr(self, key)
+
+
+class FeeContract:
+    @staticmethod
+    def changeFee(_initialFee: int) -> str:
+        return '0x6a1db1bf' + encode_abi(['uint256'], [_initialFee]).hex()
+
+    @staticmethod
+    def initialFee() -> str:
+        return '0x9c00316e'
+
+    @staticmethod
+    def decode_initialFee(data: bytes) -> int:
+        values = decode_abi(['uint256'], data)
+        return values[0]
+
+    @staticmethod
+    def owner() -> str:
+        return '0x8da5cb5b'
+
+    @staticmethod
+    def decode_owner(data: bytes) -> str:
+        values = decode_abi(['address'], data)
+        return to_checksum_address(values[0])
+
+    @staticmethod
+    def paidFee(arg0: str) -> str:
+        return '0x591a726f' + encode_abi(['address'], [arg0]).hex()
+
+    @staticmethod
+    def decode_paidFee(data: bytes) -> bool:
+        values = decode_abi(['bool'], data)
+        return values[0]
+
+    @staticmethod
+    def pay() -> str:
+        return '0x1b9265b8'
+
+    @staticmethod
+    def renounceOwnership() -> str:
+        return '0x715018a6'
+
+    @staticmethod
+    def transferOwnership(newOwner: str) -> str:
+        return '0xf2fde38b' + encode_abi(['address'], [newOwner]).hex()
+
+
+class FilterContract:
+    @staticmethod
+    def filter(_sender: str, _destination: str) -> str:
+        return '0xe1917fda' + encode_abi(['address', 'address'], [_sender, _destination]).hex()
+
+    @staticmethod
+    def decode_filter(data: bytes) -> bool:
+        values = decode_abi(['bool'], data)
+        return values[0]
+
+    @staticmethod
+    def kycContract() -> str:
+        return '0x6d3123eb'
+
+    @staticmethod
+    def decode_kycContract(data: bytes) -> str:
+        values = decode_abi(['address'], data)
+        return to_checksum_address(values[0])
+
+    @staticmethod
+    def setFilterLevel(_level: int) -> str:
+        return '0xd1a23b90' + encode_abi(['uint256'], [_level]).hex()
+
+    @staticmethod
+    def viewFilterLevel() -> str:
+        return '0x2cea8391'
+
+    @staticmethod
+    def decode_viewFilterLevel(data: bytes) -> int:
+        values = decode_abi(['uint256'], data)
+        return values[0]
+
+
+class KYCContract:
+    @staticmethod
+    def DEFAULT_ADMIN_ROLE() -> str:
+        return '0xa217fddf'
+
+    @staticmethod
+    def decode_DEFAULT_ADMIN_ROLE(data: bytes) -> bytes:
+        values = decode_abi(['bytes32'], data)
+        return values[0]
+
+    @staticmethod
+    def KYCCentre() -> str:
+        return '0xd56f5003'
+
+    @staticmethod
+    def decode_KYCCentre(data: bytes) -> bytes:
+        values = decode_abi(['bytes32'], data)
+        return values[0]
+
+    @staticmethod
+    def _escrow() -> str:
+        return '0x0619c07a'
+
+    @staticmethod
+    def decode__escrow(data: bytes) -> str:
+        values = decode_abi(['address'], data)
+        return to_checksum_address(values[0])
+
+    @staticmethod
+    def approveKYCRequest(_index: int) -> str:
+        return '0x90ec8f7e' + encode_abi(['uint256'], [_index]).hex()
+
+    @staticmethod
+    def createKYCRequest(_level: int, _data: bytes) -> str:
+        return '0x1a710673' + encode_abi(['uint256', 'bytes32'], [_level, _data]).hex()
+
+    @staticmethod
+    def declineRequest(_index: int) -> str:
+        return '0x399b4ddc' + encode_abi(['uint256'], [_index]).hex()
+
+    @staticmethod
+    def decreaseKYCLevel(user: str, _level: int) -> str:
+        return '0x8e6156a1' + encode_abi(['address', 'uint256'], [user, _level]).hex()
+
+    @staticmethod
+    def getLastGlobalRequestIndexOfAddress(_address: str) -> str:
+        return '0x620472cf' + encode_abi(['address'], [_address]).hex()
+
+    @staticmethod
+    def decode_getLastGlobalRequestIndexOfAddress(data: bytes) -> int:
+        values = decode_abi(['uint256'], data)
+        return values[0]
+
+    @staticmethod
+    def getRoleAdmin(role: bytes) -> str:
+        return '0x248a9ca3' + encode_abi(['bytes32'], [role]).hex()
+
+    @staticmethod
+    def decode_getRoleAdmin(data: bytes) -> bytes:
+        values = decode_abi(['bytes32'], data)
+        return values[0]
+
+    @staticmethod
+    def getRoleMember(role: bytes, index: int) -> str:
+        return '0x9010d07c' + encode_abi(['bytes32', 'uint256'], [role, index]).hex()
+
+    @staticmethod
+    def decode_getRoleMember(data: bytes) -> str:
+        values = decode_abi(['address'], data)
+        return to_checksum_address(values[0])
+
+    @staticmethod
+    def getRoleMemberCount(role: bytes) -> str:
+        return '0xca15c873' + encode_abi(['bytes32'], [role]).hex()
+
+    @staticmethod
+    def decode_getRoleMemberCount(data: bytes) -> int:
+        values = decode_abi(['uint256'], data)
+        return values[0]
+
+    @staticmethod
+    def grantRole(role: bytes, account: str) -> str:
+        return '0x2f2ff15d' + encode_abi(['bytes32', 'address'], [role, account]).hex()
+
+    @staticmethod
+    def hasRole(role: bytes, account: str) -> str:
+        return '0x91d14854' + encode_abi(['bytes32', 'address'], [role, account]).hex()
+
+    @staticmethod
+    def decode_hasRole(data: bytes) -> bool:
+        values = decode_abi(['bool'], data)
+        return values[0]
+
+    @staticmethod
+    def kycCentreRequests(arg0: str, arg1: int) -> str:
+        return '0x192416cb' + encode_abi(['address', 'uint256'], [arg0, arg1]).hex()
+
+    @staticmethod
+    def decode_kycCentreRequests(data: bytes) -> int:
+        values = decode_abi(['uint256'], data)
+        return values[0]
+
+    @staticmethod
+    def kycRequests(arg0: int) -> str:
+        return '0x2470cfe0' + encode_abi(['uint256'], [arg0]).hex()
+
+    @staticmethod
+    def decode_kycRequests(data: bytes) -> Tuple[str, bytes, int, int, str, int]:
+        values = decode_abi(['address', 'bytes32', 'uint256', 'uint256', 'address', 'uint256'], data)
+        return (
+            to_checksum_address(values[0]),
+            values[1],
+            values[2],
+            values[3],
+            to_checksum_address(values[4]),
+            values[5],
+        )
+
+    @staticmethod
+    def level(arg0: str) -> str:
+        return '0xd41b6db6' + encode_abi(['address'], [arg0]).hex()
+
+    @staticmethod
+    def decode_level(data: bytes) -> int:
+        values = decode_abi(['uint256'], data)
+        return values[0]
+
+    @staticmethod
+    def levelPrices(arg0: int) -> str:
+        return '0x48135df0' + encode_abi(['uint256'], [arg0]).hex()
+
+    @staticmethod
+    def decode_levelPrices(data: bytes) -> int:
+        values = decode_abi(['uint256'], data)
+        return values[0]
+
+    @staticmethod
+    def payments(dest: str) -> str:
+        return '0xe2982c21' + encode_abi(['address'], [dest]).hex()
+
+    @staticmethod
+    def decode_payments(data: bytes) -> int:
+        values = decode_abi(['uint256'], data)
+        return values[0]
+
+    @staticmethod
+    def renounceRole(role: bytes, account: str) -> str:
+        return '0x36568abe' + encode_abi(['bytes32', 'address'], [role, account]).hex()
+
+    @staticmethod
+    def repairLostRequest() -> str:
+        return '0x75e4107f'
+
+    @staticmethod
+    def revokeRole(role: bytes, account: str) -> str:
+        return '0xd547741f' + encode_abi(['bytes32', 'address'], [role, account]).hex()
+
+    @staticmethod
+    def setLevelPrice(_level: int, price: int) -> str:
+        return '0xf5eb4352' + encode_abi(['uint256', 'uint256'], [_level, price]).hex()
+
+    @staticmethod
+    def supportsInterface(interfaceId: bytes) -> str:
+        return '0x01ffc9a7' + encode_abi(['bytes4'], [interfaceId]).hex()
+
+    @staticmethod
+    def decode_supportsInterface(data: bytes) -> bool:
+        values = decode_abi(['bool'], data)
+        return values[0]
+
+    @staticmethod
+    def userKYCRequests(arg0: str, arg1: int) -> str:
+        return '0x599bd4e3' + encode_abi(['address', 'uint256'], [arg0, arg1]).hex()
+
+    @staticmethod
+    def decode_userKYCRequests(data: bytes) -> int:
+        values = decode_abi(['uint256'], data)
+        return values[0]
+
+    @staticmethod
+    def viewMyLastRequest() -> str:
+        return '0x847192d9'
+
+    @staticmethod
+    def decode_viewMyLastRequest(data: bytes) -> KYCRequest:
+        values = decode_abi(['(address,bytes32,uint256,uint256,address,uint256)'], data)
+        return KYCRequest.from_tuple(values[0])
+
+    @staticmethod
+    def viewMyRequest(userIndex: int) -> str:
+        return '0xb74091e8' + encode_abi(['uint256'], [userIndex]).hex()
+
+    @staticmethod
+    def decode_viewMyRequest(data: bytes) -> KYCRequest:
+        values = decode_abi(['(address,bytes32,uint256,uint256,address,uint256)'], data)
+        return KYCRequest.from_tuple(values[0])
+
+    @staticmethod
+    def viewRequestAssignedToCentre(_centre: str, _localIndex: int) -> str:
+        return '0x0e8723dc' + encode_abi(['address', 'uint256'], [_centre, _localIndex]).hex()
+
+    @staticmethod
+    def decode_viewRequestAssignedToCentre(data: bytes) -> Tuple[KYCRequest, int]:
+        values = decode_abi(['(address,bytes32,uint256,uint256,address,uint256)', 'uint256'], data)
+        return (
+            KYCRequest.from_tuple(values[0]),
+            values[1],
+        )
+
+    @staticmethod
+    def withdrawPayments(payee: str) -> str:
+        return '0x31b3eb94' + encode_abi(['address'], [payee]).hex()
@@ -1,33 +1,57 @@
-import json
+from typing import List
 
 import pytest
 from eth_account.signers.local import LocalAccount
+from hexbytes import HexBytes
 from web3 import Web3
 from web3.contract import Contract
 
-from utils.transaction_util import send_transaction
+from contract.bindings import FeeContract
+from utils import contract_registry
+from utils.rpc_batch import RpcBatch
+from utils.transaction_util import submit_transaction, wait_all, call
 
 _contract: Contract
 
 
 @pytest.fixture(autouse=True, scope='session')
 def fee_contract(web3) -> Contract:
-    with open("./artifacts/FeeContract.abi") as f:
-        abi = json.load(f)
+    return load_fee_contract(web3)
 
+
+def load_fee_contract(web3) -> Contract:
     global _contract
-    _contract = web3.eth.contract(abi=abi, address="0x0000000000000000000000000000000000001000")
+    _contract = contract_registry.contract(web3, 'FeeContract')
     return _contract
 
 
 def activate_account(web3: Web3, account: LocalAccount):
-    is_active = _contract.functions.paidFee(account.address).call()
+    wait_all(web3, [submit_activation(web3, account)])
+
+
+def submit_activation(web3: Web3, account: LocalAccount):
+    is_active = FeeContract.decode_paidFee(call(web3, _contract.address, FeeContract.paidFee(account.address)))
     if is_active:
-        return
-    fee = _contract.functions.initialFee().call()
-    tx = _contract.functions.pay().buildTransaction({
+        return None
+    return submit_transaction(web3, activation_transaction(account, get_initial_fee()), account)
+
+
+def get_paid_fees(web3: Web3, accounts: List[LocalAccount]) -> List[bool]:
+    batch = RpcBatch(web3)
+    for account in accounts:
+        batch.request('eth_call', [{'to': _contract.address, 'data': FeeContract.paidFee(account.address)}, 'latest'],
+                      lambda result: FeeContract.decode_paidFee(HexBytes(result)))
+    return batch.execute()
+
+
+def get_initial_fee():
+    return FeeContract.decode_initialFee(call(_contract.web3, _contract.address, FeeContract.initialFee()))
+
+
+def activation_transaction(account: LocalAccount, fee):
+    return {
         'from': account.address,
-        'value': fee,
-        'gasPrice': web3.eth.gas_price
-    })
-    send_transaction(web3, tx, account)
+        'to': _contract.address,
+        'data': FeeContract.pay(),
+        'value': fee
+    }
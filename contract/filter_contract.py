@@ -1,30 +1,37 @@
-import json
-
 import pytest
 from web3.contract import Contract
 
-from utils.transaction_util import send_transaction
+from contract.bindings import FilterContract
+from utils import contract_registry
+from utils.transaction_util import submit_transaction, transact, call
 
 _contract: Contract
 
 
 @pytest.fixture(autouse=True, scope='session')
 def filter_contract(web3) -> Contract:
-    with open("./artifacts/FilterContract.abi") as f:
-        abi = json.load(f)
+    return load_filter_contract(web3)
+
 
+def load_filter_contract(web3) -> Contract:
     global _contract
-    _contract = web3.eth.contract(abi=abi, address="0x0000000000000000000000000000000000001002")
+    _contract = contract_registry.contract(web3, 'FilterContract')
     return _contract
 
 
 def set_filter_level(web3, account, level):
-    tx = _contract.functions.setFilterLevel(level).buildTransaction({
+    transact(web3, _contract.address, FilterContract.setFilterLevel(level), account)
+
+
+def submit_set_filter_level(web3, account, level):
+    tx = {
         'from': account.address,
-        'gasPrice': web3.eth.gas_price
-    })
-    send_transaction(web3, tx, account)
+        'to': _contract.address,
+        'data': FilterContract.setFilterLevel(level)
+    }
+    return submit_transaction(web3, tx, account)
 
 
 def get_filter_level(account):
-    return _contract.functions.viewFilterLevel().call({'from': account.address})
+    return FilterContract.decode_viewFilterLevel(
+        call(_contract.web3, _contract.address, FilterContract.viewFilterLevel(), account.address))
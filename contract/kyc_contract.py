@@ -1,34 +1,46 @@
-import json
+from collections import defaultdict
+from typing import List
 
 import pytest
 from eth_account.signers.local import LocalAccount
+from hexbytes import HexBytes
 from web3.constants import HASH_ZERO
 from web3.contract import Contract
 
-from contract.fee_contract import activate_account
-from utils.transaction_util import send_transaction
+from contract.bindings import KYCContract, KYCRequest
+from contract.fee_contract import submit_activation
+from utils import contract_registry
+from utils.parallel import is_parallel_worker
+from utils.transaction_util import submit_transaction, wait_all, transact, call, decode_events
 
 KYCCentreRole = "79fce87046aae5e678100c84cc5c4708df4209fab036250bb81408ada9b857ef"
 ADMIN_ROLE = "0x0000000000000000000000000000000000000000000000000000000000000000"
+_KYC_CENTRE_ROLE = bytes.fromhex(KYCCentreRole)
 _contract: Contract
+_request_indices = defaultdict(list)
 
 
 @pytest.fixture(scope='session')
 def kyc_contract(web3) -> Contract:
-    with open("./artifacts/KYCContract.abi") as f:
-        abi = json.load(f)
+    return load_kyc_contract(web3)
 
+
+def load_kyc_contract(web3) -> Contract:
     global _contract
-    _contract = web3.eth.contract(abi=abi, address="0x0000000000000000000000000000000000001001")
+    _contract = contract_registry.contract(web3, 'KYCContract')
     return _contract
 
 
 @pytest.fixture
-def kyc_centre(web3, contracts_admin) -> LocalAccount:
-    centre = web3.eth.account.privateKeyToAccount("ed4c65f1bf6c622f5954ff39932c192b26a963abcc65d56f9487d4cabe9301f1")
-    activate_account(web3, centre)
-    grant_kyc_centre_role(web3, centre, contracts_admin)
-    return centre
+def kyc_centre(request, web3, kyc_centre_account, contracts_admin) -> LocalAccount:
+    centre = kyc_centre_account
+    wait_all(web3, [
+        submit_activation(web3, centre),
+        submit_grant_kyc_centre_role(web3, centre, contracts_admin)
+    ])
+    yield centre
+    if is_parallel_worker(request.config) and request.node.get_closest_marker('serial'):
+        grant_kyc_centre_role(web3, centre, contracts_admin)
 
 
 @pytest.fixture
@@ -44,61 +56,90 @@ def new_kyc_centre(web3, active_account, contracts_admin):
 
 
 def grant_kyc_centre_role(web3, beneficiary, admin):
+    wait_all(web3, [submit_grant_kyc_centre_role(web3, beneficiary, admin)])
+
+
+def submit_grant_kyc_centre_role(web3, beneficiary, admin):
     if has_kyc_centre_role(beneficiary):
-        return
+        return None
 
-    tx = _contract.functions.grantRole(KYCCentreRole, beneficiary.address).buildTransaction({
+    tx = {
         'from': admin.address,
-        'gasPrice': web3.eth.gas_price
-    })
-    send_transaction(web3, tx, admin)
+        'to': _contract.address,
+        'data': KYCContract.grantRole(_KYC_CENTRE_ROLE, beneficiary.address)
+    }
+    return submit_transaction(web3, tx, admin)
 
 
 def renounce_kyc_centre_role(web3, account):
-    tx = _contract.functions.renounceRole(KYCCentreRole, account.address).buildTransaction({
-        'from': account.address,
-        'gasPrice': web3.eth.gas_price
-    })
-    send_transaction(web3, tx, account)
+    transact(web3, _contract.address, KYCContract.renounceRole(_KYC_CENTRE_ROLE, account.address), account)
 
 
 def has_kyc_centre_role(account: LocalAccount) -> bool:
-    return _contract.functions.hasRole(KYCCentreRole, account.address).call()
+    return KYCContract.decode_hasRole(_call(KYCContract.hasRole(_KYC_CENTRE_ROLE, account.address)))
 
 
 def create_request(web3, requester, level=1):
     deposit = get_level_price(level)
-    tx = _contract.functions.createKYCRequest(level, HASH_ZERO).buildTransaction({
+    receipt = transact(web3, _contract.address, KYCContract.createKYCRequest(level, HexBytes(HASH_ZERO)), requester,
+                       deposit)
+    return created_request_index(web3, receipt)
+
+
+def submit_create_request(web3, requester, level=1):
+    tx = {
         'from': requester.address,
-        'value': deposit,
-        'gasPrice': web3.eth.gas_price
-    })
-    send_transaction(web3, tx, requester)
-    return get_global_request_index_of_address(requester.address)
+        'to': _contract.address,
+        'data': KYCContract.createKYCRequest(level, HexBytes(HASH_ZERO)),
+        'value': get_level_price(level)
+    }
+    return submit_transaction(web3, tx, requester)
+
+
+def created_request_index(web3, receipt) -> int:
+    index = next((event['args']['index'] for event in decode_events(web3, receipt['logs'])
+                  if event['event'] == 'RequestCreated'), None)
+    if index is None:
+        raise ValueError('transaction {} did not emit RequestCreated'.format(receipt['transactionHash'].hex()))
+    _request_indices[receipt['from']].append(index)
+    return index
+
+
+def request_indices(address) -> List[int]:
+    return list(_request_indices[address])
+
+
+def forget_request_indices():
+    _request_indices.clear()
 
 
 def approve_request(web3, request_index, centre):
-    tx = _contract.functions.approveKYCRequest(request_index).buildTransaction({
+    transact(web3, _contract.address, KYCContract.approveKYCRequest(request_index), centre)
+
+
+def submit_approve_request(web3, request_index, centre):
+    tx = {
         'from': centre.address,
-        'gasPrice': web3.eth.gas_price
-    })
-    send_transaction(web3, tx, centre)
+        'to': _contract.address,
+        'data': KYCContract.approveKYCRequest(request_index)
+    }
+    return submit_transaction(web3, tx, centre)
 
 
 def decline_request(web3, request_index, centre):
-    tx = _contract.functions.declineRequest(request_index).buildTransaction({
-        'from': centre.address,
-        'gasPrice': web3.eth.gas_price
-    })
-    send_transaction(web3, tx, centre)
+    transact(web3, _contract.address, KYCContract.declineRequest(request_index), centre)
 
 
 def withdraw_request(web3, account):
-    tx = _contract.functions.repairLostRequest().buildTransaction({
-        'from': account.address,
-        'gasPrice': web3.eth.gas_price
-    })
-    send_transaction(web3, tx, account)
+    transact(web3, _contract.address, KYCContract.repairLostRequest(), account)
+
+
+def withdraw_payments(web3, account, payee=None):
+    transact(web3, _contract.address, KYCContract.withdrawPayments((payee or account).address), account)
+
+
+def decrease_kyc_level(web3, user_address, level, centre):
+    transact(web3, _contract.address, KYCContract.decreaseKYCLevel(user_address, level), centre)
 
 
 def get_level_price(level):
@@ -106,26 +147,21 @@ def get_level_price(level):
     return level * 1000
 
 
-def get_user_request(address, index=0):
-    request = _contract.functions.viewMyRequest(index).call({'from': address})
-    return convert_kyc_request(request)
+def get_user_request(address, index=0) -> KYCRequest:
+    return KYCContract.decode_viewMyRequest(_call(KYCContract.viewMyRequest(index), address))
 
 
-def get_global_request_index_of_address(address, local_index=0):
-    # return _contract.functions.getLastGlobalRequestIndexOfAddress(address).call()
-    return _contract.functions.userKYCRequests(address, local_index).call()
+def get_request(request_index) -> KYCRequest:
+    return KYCRequest.from_tuple(KYCContract.decode_kycRequests(_call(KYCContract.kycRequests(request_index))))
 
 
 def get_payments(address):
-    return _contract.functions.payments(address).call()
-
-
-def convert_kyc_request(request) -> dict:
-    return dict({
-        'user': request[0],
-        'data': request[1],
-        'level': request[2],
-        'status': request[3],
-        'centre': request[4],
-        'deposit': request[5]
-    })
+    return KYCContract.decode_payments(_call(KYCContract.payments(address)))
+
+
+def convert_kyc_request(request) -> KYCRequest:
+    return KYCRequest.from_tuple(request)
+
+
+def _call(data, address=None) -> bytes:
+    return call(_contract.web3, _contract.address, data, address)
@@ -1,10 +1,102 @@
+import logging
+
 import pytest
-from web3 import Web3, HTTPProvider
+from eth_account import Account
+from web3 import Web3, HTTPProvider, WebsocketProvider
 from web3.middleware import geth_poa_middleware
 
+from utils.account_util import ALPHA_KEY, CONTRACTS_ADMIN_KEY, KYC_CENTRE_KEY
+from utils.call_cache import CallCache
+from utils.chain_params import ChainParameters, parse_gas_price_refresh
+from utils.http_session import pooled_session
+from utils.local_chain import local_chain_provider
+from utils.rpc_cassette import CassetteProvider, cassette_library, REPLAY
+from utils.rpc_metrics import rpc_metrics
+from utils.receipt_waiter import NewHeadsReceiptWaiter, PollingReceiptWaiter, is_websocket_uri
+from utils.transaction_util import add_receipt_listener, remove_receipt_listener, use_receipt_waiter, reset_nonces
+from utils.tx_scheduler import TxScheduler
+
+logger = logging.getLogger()
+
+
+@pytest.fixture(scope='session')
+def chain_params(request):
+    params = ChainParameters(parse_gas_price_refresh(request.config.getoption('--gas-price-refresh')))
+    add_receipt_listener(params.observe_receipt)
+    yield params
+    remove_receipt_listener(params.observe_receipt)
+    logger.info('CHAIN PARAMS CACHE saved {} RPCs: {}'.format(sum(params.saved_rpcs.values()),
+                                                              dict(params.saved_rpcs)))
+
 
 @pytest.fixture(scope='session')
-def web3(node):
-    web3 = Web3(HTTPProvider(node))
+def call_cache(request):
+    # cassettes replay responses by position, so a wall-clock TTL would change which calls reach the provider
+    max_age = 0 if cassette_library().active else request.config.getoption('--call-cache-ttl')
+    cache = CallCache(max_age=max_age)
+    add_receipt_listener(cache.observe_receipt)
+    yield cache
+    remove_receipt_listener(cache.observe_receipt)
+    logger.info('CALL CACHE saved {} RPCs'.format(sum(cache.saved_rpcs.values())))
+
+
+@pytest.fixture(scope='session')
+def web3(request, node, chain_params, call_cache):
+    web3 = Web3(_provider(request.config, node))
     web3.middleware_onion.inject(geth_poa_middleware, layer=0)
+    web3.middleware_onion.inject(chain_params.middleware, name='chain_params', layer=0)
+    web3.middleware_onion.inject(call_cache.middleware, name='call_cache', layer=0)
+    web3.middleware_onion.inject(rpc_metrics().middleware, name='rpc_metrics', layer=0)
     return web3
+
+
+@pytest.fixture(autouse=True)
+def cassette_isolation(chain_params):
+    if cassette_library().active:
+        # nonces and gas price are read again inside every test, so its cassette does not depend on earlier tests
+        chain_params.invalidate()
+        reset_nonces()
+
+
+@pytest.fixture
+def tx_scheduler(web3):
+    scheduler = TxScheduler(web3)
+    yield scheduler
+    assert not scheduler, 'transactions were scheduled but never run'
+
+
+@pytest.fixture(scope='session', autouse=True)
+def receipt_waiter(request, node, web3):
+    library = cassette_library()
+    if library.mode == REPLAY:
+        waiter = PollingReceiptWaiter(web3, min_interval=0, max_interval=0)
+    elif request.config.getoption('--backend') == 'node' and is_websocket_uri(node) and not library.active:
+        waiter = NewHeadsReceiptWaiter(node)
+    else:
+        waiter = PollingReceiptWaiter(web3)
+    use_receipt_waiter(web3, waiter)
+    yield waiter
+    use_receipt_waiter(web3, None)
+    if isinstance(waiter, NewHeadsReceiptWaiter):
+        waiter.close()
+
+
+def _provider(config, node):
+    library = cassette_library()
+    if library.mode == REPLAY:
+        return CassetteProvider(library)
+    if library.active:
+        return CassetteProvider(library, _node_provider(config, node))
+    return _node_provider(config, node)
+
+
+def _node_provider(config, node):
+    if config.getoption('--backend') == 'local':
+        keys = (ALPHA_KEY, CONTRACTS_ADMIN_KEY, KYC_CENTRE_KEY)
+        return local_chain_provider([Account.from_key(key).address for key in keys])
+    timeout = config.getoption('--node-timeout')
+    if is_websocket_uri(node):
+        return WebsocketProvider(node, websocket_timeout=timeout)
+    session = pooled_session(pool_size=config.getoption('--node-pool-size'),
+                             retries=config.getoption('--node-retries'))
+    return HTTPProvider(node, request_kwargs={'timeout': timeout}, session=session)
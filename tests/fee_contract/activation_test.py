@@ -8,6 +8,7 @@ initial_fee = 1000
 
 
 @allure.title("User with an inactive account can't send funds")
+@pytest.mark.node_rules
 def test_inactive_account_cant_send_funds(web3, random_account, alpha_account):
     alice = random_account
     tx = {
@@ -47,15 +48,11 @@ def overpayment_returns(web3, random_account, fee_contract):
         'gasPrice': web3.eth.gas_price
     })
 
-    tx_hash = send_transaction(web3, tx, alice)
+    result = send_transaction(web3, tx, alice, details=True, calls=[fee_contract.functions.paidFee(alice.address)])
 
-    activated = fee_contract.functions.paidFee(alice.address).call()
+    (activated,) = result.call_results
     assert activated is True
-
-    receipt = web3.eth.get_transaction_receipt(tx_hash)
-    estimated_balance = web3.toWei(1, 'ether') - receipt['gasUsed'] * web3.eth.gas_price - (overpaid_fee - initial_fee)
-    actual_balance = web3.eth.get_balance(alice.address)
-    assert actual_balance == estimated_balance
+    assert result.balance_change(alice.address) == -result.fee - (overpaid_fee - initial_fee)
 
 
 @allure.title("User can't activate account by paying fee less than required")
@@ -1,25 +1,28 @@
 import allure
 import pytest
 
-from contract.filter_contract import get_filter_level, set_filter_level
-from contract.kyc_contract import create_request, approve_request
+from contract.filter_contract import get_filter_level, submit_set_filter_level
+from contract.kyc_contract import submit_create_request, submit_approve_request, created_request_index
 from utils.transaction_util import send_transaction, error_message
 
 
 @pytest.fixture
-def account_with_kyc_level(web3, kyc_contract, kyc_centre, active_account):
+def account_with_kyc_level(web3, kyc_contract, kyc_centre, active_account, tx_scheduler):
     def account_with_kyc_level(level):
-        index = create_request(web3, active_account, level)
-        approve_request(web3, index, kyc_centre)
+        created = tx_scheduler.add(lambda: submit_create_request(web3, active_account, level),
+                                   name='createKYCRequest')
+        tx_scheduler.add(lambda receipt: submit_approve_request(web3, created_request_index(web3, receipt),
+                                                                kyc_centre),
+                         after=[created], name='approveKYCRequest')
         return active_account
 
     return account_with_kyc_level
 
 
 @pytest.fixture
-def account_with_filter_level(web3, filter_contract, active_account):
+def account_with_filter_level(web3, filter_contract, active_account, tx_scheduler):
     def account_with_filter_level(level):
-        set_filter_level(web3, active_account, level)
+        tx_scheduler.add(lambda: submit_set_filter_level(web3, active_account, level), name='setFilterLevel')
         return active_account
 
     return account_with_filter_level
@@ -54,9 +57,10 @@ def test_set_filter_level(web3, filter_contract, active_account, level):
 
 
 @allure.title("User with sufficient KYC level can send funds to another user with configured filter")
-def test_send_funds_to_user_with_filter(web3, account_with_kyc_level, account_with_filter_level):
+def test_send_funds_to_user_with_filter(web3, account_with_kyc_level, account_with_filter_level, tx_scheduler):
     alice = account_with_kyc_level(1)
     bob = account_with_filter_level(1)
+    tx_scheduler.run()
 
     tx = {
         'to': bob.address,
@@ -69,9 +73,10 @@ def test_send_funds_to_user_with_filter(web3, account_with_kyc_level, account_wi
 
 
 @allure.title("User with high KYC level can send funds to user with configured filter")
-def test_user_with_high_kyc_level_sends_funds(web3, account_with_kyc_level, account_with_filter_level):
+def test_user_with_high_kyc_level_sends_funds(web3, account_with_kyc_level, account_with_filter_level, tx_scheduler):
     alice = account_with_kyc_level(2)
     bob = account_with_filter_level(1)
+    tx_scheduler.run()
 
     tx = {
         'to': bob.address,
@@ -84,9 +89,11 @@ def test_user_with_high_kyc_level_sends_funds(web3, account_with_kyc_level, acco
 
 
 @allure.title("User with insufficient KYC level can't send funds to user with configured filter")
-def test_user_with_insufficient_kyc_level_sends_funds(web3, active_account, account_with_filter_level):
+@pytest.mark.node_rules
+def test_user_with_insufficient_kyc_level_sends_funds(web3, active_account, account_with_filter_level, tx_scheduler):
     alice = active_account
     bob = account_with_filter_level(1)
+    tx_scheduler.run()
     tx = {
         'to': bob.address,
         'value': web3.toWei(0.1, 'ether')
@@ -98,8 +105,9 @@ def test_user_with_insufficient_kyc_level_sends_funds(web3, active_account, acco
 
 
 @allure.title("User can get own filter level")
-def test_get_own_filter_level(web3, filter_contract, account_with_filter_level):
+def test_get_own_filter_level(web3, filter_contract, account_with_filter_level, tx_scheduler):
     alice = account_with_filter_level(1)
+    tx_scheduler.run()
 
     actual_level = filter_contract.functions.viewFilterLevel().call({'from': alice.address})
 
@@ -107,9 +115,11 @@ def test_get_own_filter_level(web3, filter_contract, account_with_filter_level):
 
 
 @allure.title("User check that a transfer from sender address to destination address will be rejected by nodes")
-def test_check_transfer_will_be_rejected(web3, filter_contract, account_with_kyc_level, account_with_filter_level):
+def test_check_transfer_will_be_rejected(web3, filter_contract, account_with_kyc_level, account_with_filter_level,
+                                         tx_scheduler):
     alice = account_with_kyc_level(1)
     bob = account_with_filter_level(2)
+    tx_scheduler.run()
 
     is_not_rejected = filter_contract.functions.filter(alice.address, bob.address).call()
 
@@ -119,9 +129,10 @@ def test_check_transfer_will_be_rejected(web3, filter_contract, account_with_kyc
 @allure.title("User can check that a transfer from sender address to destination address won't be rejected by nodes")
 @pytest.mark.parametrize("kyc_level", [1, 2])
 def test_check_transfer_will_not_be_rejected(web3, filter_contract, account_with_kyc_level,
-                                             account_with_filter_level, kyc_level):
+                                             account_with_filter_level, tx_scheduler, kyc_level):
     alice = account_with_kyc_level(kyc_level)
     bob = account_with_filter_level(1)
+    tx_scheduler.run()
 
     is_not_rejected = filter_contract.functions.filter(alice.address, bob.address).call()
 
@@ -1,11 +1,18 @@
 import pytest
 
+from utils.account_util import ALPHA_KEY, CONTRACTS_ADMIN_KEY, KYC_CENTRE_KEY
+
 
 @pytest.fixture(scope='session')
 def alpha_account(web3):
-    return web3.eth.account.privateKeyToAccount('16bd6f1fafed1f1f1ae9d27db97064589be7207946735225782f5726f4195f85')
+    return web3.eth.account.privateKeyToAccount(ALPHA_KEY)
 
 
 @pytest.fixture(scope='session')
 def contracts_admin(web3):
-    return web3.eth.account.privateKeyToAccount('4f3432f05f0f66fc2ba987acc522499ee29bc20201617a54cc5f992549a3ce65')
+    return web3.eth.account.privateKeyToAccount(CONTRACTS_ADMIN_KEY)
+
+
+@pytest.fixture(scope='session')
+def kyc_centre_account(web3):
+    return web3.eth.account.privateKeyToAccount(KYC_CENTRE_KEY)
@@ -13,6 +13,7 @@ def role_beneficiary(web3, active_account):
     renounce_kyc_centre_role(web3, active_account)
 
 
+@pytest.mark.serial
 @allure.title("User with KYC-Center admin role can grant KYC-Center role")
 def test_grant_role_by_role_admin(web3, kyc_contract, role_beneficiary, contracts_admin):
     tx = kyc_contract.functions.grantRole(KYCCentreRole, role_beneficiary.address).buildTransaction({
@@ -40,6 +41,7 @@ def test_grant_role_by_not_role_admin(web3, kyc_contract, active_account, alpha_
         assert_that(has_kyc_centre_role(bob)).is_false()
 
 
+@pytest.mark.serial
 @allure.title("User with KYC-Center admin role can revoke KYC-Center role")
 def test_revoke_role_by_role_admin(web3, kyc_contract, kyc_centre, contracts_admin):
     tx = kyc_contract.functions.revokeRole(KYCCentreRole, kyc_centre.address).buildTransaction({
@@ -66,6 +68,7 @@ def test_revoke_role_by_not_role_admin(web3, kyc_contract, active_account, kyc_c
         assert_that(has_kyc_centre_role(kyc_centre)).is_true()
 
 
+@pytest.mark.serial
 @allure.title("User with KYC-Center role can renounce KYC-Center role for self")
 def test_renounce_role_for_self(web3, kyc_contract, kyc_centre):
     tx = kyc_contract.functions.renounceRole(KYCCentreRole, kyc_centre.address).buildTransaction({
@@ -96,6 +99,7 @@ def test_find_out_admin_role(web3, kyc_contract):
     assert role.hex() == 64 * '0'
 
 
+@pytest.mark.serial
 @allure.title("User can find out number of accounts that have KYC-Center role")
 def test_find_out_number_of_kyc_centres(web3, kyc_contract, kyc_centre, new_kyc_centre):
     new_kyc_centre()
@@ -105,6 +109,7 @@ def test_find_out_number_of_kyc_centres(web3, kyc_contract, kyc_centre, new_kyc_
     assert number == 2
 
 
+@pytest.mark.serial
 @allure.title("User can find out number of accounts that have KYC-Center role when no one has such role")
 def test_find_out_number_of_kyc_centres_when_no_centres(web3, kyc_contract, kyc_centre):
     renounce_kyc_centre_role(web3, kyc_centre)
@@ -114,6 +119,7 @@ def test_find_out_number_of_kyc_centres_when_no_centres(web3, kyc_contract, kyc_
     assert number == 0
 
 
+@pytest.mark.serial
 @allure.title("User can find out one of accounts that have KYC-Center role")
 def test_find_out_account_with_role(web3, kyc_contract, kyc_centre, new_kyc_centre):
     another_kyc_centre = new_kyc_centre()
@@ -133,6 +139,7 @@ def test_find_out_account_with_role_by_incorrect_index(web3, kyc_contract, kyc_c
     assert revert_message(error) == 'execution reverted'
 
 
+@pytest.mark.serial
 @allure.title("User can't get one of accounts that have KYC-Center role if no one has such role")
 def test_find_out_account_with_role_when_no_one_has_role(web3, kyc_contract, kyc_centre):
     renounce_kyc_centre_role(web3, kyc_centre)
@@ -149,6 +156,7 @@ def test_check_account_has_role(web3, kyc_contract, kyc_centre):
     assert has_role is True
 
 
+@pytest.mark.serial
 @allure.title("User can check if account don't have KYC-Center role")
 def test_check_account_do_not_have_role(web3, kyc_contract, kyc_centre):
     renounce_kyc_centre_role(web3, kyc_centre)
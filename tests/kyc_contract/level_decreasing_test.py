@@ -6,6 +6,7 @@ from contract.kyc_contract import create_request, approve_request, renounce_kyc_
 from utils.transaction_util import send_transaction, revert_message
 
 
+@pytest.mark.serial
 @allure.title("KYC Center can decrease KYC level of any user")
 @pytest.mark.parametrize("decreased_level", [1, 0])
 def test_decrease_level_by_kyc_centre(web3, kyc_contract, active_account, kyc_centre, new_kyc_centre, decreased_level):
@@ -39,6 +40,7 @@ def test_increase_level_by_decrease_method(web3, kyc_contract, active_account, k
     assert revert_message(error) == 'execution reverted: You can only decrease level'
 
 
+@pytest.mark.serial
 @allure.title("Account without KYC Center role can't decrease KYC level of user")
 def test_decrease_level_by_non_kyc_centre(web3, kyc_contract, active_account, kyc_centre):
     alice = active_account
@@ -46,6 +46,7 @@ def deposit_transfer_after_request_approving(web3, kyc_contract, active_account,
         assert_that(centre_payments - old_centre_payments).is_equal_to(deposit / 2)
 
 
+@pytest.mark.serial
 @allure.title("Account without KYC Center role can't approve request")
 def test_approving_request_by_non_kyc_centre(web3, kyc_contract, active_account, kyc_centre):
     alice = active_account
@@ -60,6 +61,7 @@ def test_approving_request_by_non_kyc_centre(web3, kyc_contract, active_account,
     assert revert_message(error) == 'execution reverted: Not allowed to approve'
 
 
+@pytest.mark.serial
 @allure.title("KYC Center can't approve request if not assigned for it")
 def test_approving_request_by_not_assigned_centre(web3, kyc_contract, active_account, kyc_centre, new_kyc_centre):
     alice = active_account
@@ -102,6 +104,7 @@ def test_approving_declined_request(web3, kyc_contract, active_account, kyc_cent
     assert revert_message(error) == 'execution reverted: This request is not pending decision'
 
 
+@pytest.mark.serial
 @allure.title("KYC Center can't approve withdrawn request")
 def test_approving_withdrawn_request(web3, kyc_contract, active_account, kyc_centre, contracts_admin):
     alice = active_account
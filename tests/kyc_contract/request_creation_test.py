@@ -66,18 +66,14 @@ def overpayment_returns(web3, kyc_contract, active_account, kyc_centre):
         'value': overpaid_deposit,
         'gasPrice': web3.eth.gas_price
     })
-    tx_hash = send_transaction(web3, tx, alice)
+    result = send_transaction(web3, tx, alice, details=True)
 
     request = get_user_request(alice.address)
     with soft_assertions():
         assert_that(request['user']).is_equal_to(alice.address)
         assert_that(request['deposit']).is_equal_to(required_deposit)
 
-    receipt = web3.eth.get_transaction_receipt(tx_hash)
-    estimated_balance = web3.toWei(1, 'ether') - receipt['gasUsed'] * web3.eth.gas_price - (
-            overpaid_deposit - required_deposit)
-    actual_balance = web3.eth.get_balance(alice.address)
-    assert actual_balance == estimated_balance
+    assert result.balance_change(alice.address) == -result.fee - (overpaid_deposit - required_deposit)
 
 
 @allure.title("User can create a KYC request for any greater level")
@@ -166,6 +162,7 @@ def test_repeat_request_creation(web3, kyc_contract, active_account, kyc_centre)
     assert revert_message(error) == 'execution reverted: Your previous request is still pending answer'
 
 
+@pytest.mark.serial
 @allure.title("User can't create KYC request if there are no KYC centres")
 def test_request_creation_when_no_kyc_centres(web3, kyc_contract, active_account, kyc_centre):
     alice = active_account
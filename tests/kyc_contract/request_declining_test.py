@@ -68,6 +68,7 @@ def deposit_transfer_after_request_declining(web3, kyc_contract, active_account,
     assert (centre_payments - old_centre_payments) == deposit
 
 
+@pytest.mark.serial
 @allure.title("Account without KYC Center role can't decline request")
 def test_declining_request_by_non_kyc_centre(web3, kyc_contract, active_account, kyc_centre):
     alice = active_account
@@ -82,6 +83,7 @@ def test_declining_request_by_non_kyc_centre(web3, kyc_contract, active_account,
     assert revert_message(error) == 'execution reverted: Not allowed to decline'
 
 
+@pytest.mark.serial
 @allure.title("KYC Center can't decline request if not assigned for it")
 def test_declining_request_by_not_assigned_centre(web3, kyc_contract, active_account, kyc_centre, new_kyc_centre):
     alice = active_account
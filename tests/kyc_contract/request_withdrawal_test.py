@@ -8,6 +8,7 @@ from contract.kyc_contract import create_request, renounce_kyc_centre_role, get_
 from utils.transaction_util import send_transaction, revert_message
 
 
+@pytest.mark.serial
 @allure.title("User can withdraw pending KYC request, if assigned KYC Center lose KYC-Center role")
 def test_withdrawal_pending_request(web3, kyc_contract, active_account, kyc_centre):
     alice = active_account
@@ -28,6 +29,7 @@ def test_withdrawal_pending_request(web3, kyc_contract, active_account, kyc_cent
         assert_that(request['centre']).is_equal_to(kyc_centre.address)
 
 
+@pytest.mark.serial
 @allure.title("Requester receives full deposit when request is withdrawn")
 def deposit_transfer_after_request_withdrawal(web3, kyc_contract, active_account, kyc_centre):
     alice = active_account
@@ -54,6 +56,7 @@ def test_withdrawal_request_with_active_kyc_centre(web3, kyc_contract, active_ac
     assert revert_message(error) == 'execution reverted: Your KYC centre is still active'
 
 
+@pytest.mark.serial
 @allure.title("User can't withdraw approved KYC request")
 def test_withdrawal_approved_request(web3, kyc_contract, active_account, kyc_centre):
     alice = active_account
@@ -69,6 +72,7 @@ def test_withdrawal_approved_request(web3, kyc_contract, active_account, kyc_cen
     assert revert_message(error) == 'execution reverted: Your last request cannot be repaired'
 
 
+@pytest.mark.serial
 @allure.title("User can't withdraw declined KYC request")
 def test_withdrawal_declined_request(web3, kyc_contract, active_account, kyc_centre):
     alice = active_account
@@ -84,6 +88,7 @@ def test_withdrawal_declined_request(web3, kyc_contract, active_account, kyc_cen
     assert revert_message(error) == 'execution reverted: Your last request cannot be repaired'
 
 
+@pytest.mark.serial
 @allure.title("User can't withdraw already withdrawn KYC request")
 def test_withdrawal_withdrawn_request(web3, kyc_contract, active_account, kyc_centre):
     alice = active_account
@@ -0,0 +1,12 @@
+import pytest
+
+
+@pytest.fixture(scope='session', autouse=True)
+def receipt_waiter():
+    # tests in this directory don't talk to --node: they fake the chain or start their own
+    return None
+
+
+@pytest.fixture(autouse=True)
+def revert_chain():
+    return None
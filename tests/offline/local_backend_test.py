@@ -0,0 +1,52 @@
+import allure
+import pytest
+from eth_account import Account
+from hexbytes import HexBytes
+from web3 import Web3
+
+from utils.contract_registry import CONTRACT_ADDRESSES
+from utils.local_chain import local_chain_provider, FUNDED_BALANCE
+from utils.rpc_batch import RpcBatch
+from utils.transaction_util import send_transaction
+
+pytest.importorskip('eth_tester')
+
+# PUSH1 0x2a PUSH1 0x00 MSTORE PUSH1 0x20 PUSH1 0x00 RETURN: any call returns uint256 42
+ANSWER_RUNTIME = '0x602a60005260206000f3'
+
+
+@pytest.fixture(scope='module')
+def sender():
+    return Account.create()
+
+
+@pytest.fixture(scope='module')
+def local_web3(tmp_path_factory, sender):
+    artifacts = tmp_path_factory.mktemp('artifacts')
+    for name in CONTRACT_ADDRESSES:
+        (artifacts / '{}.bin-runtime'.format(name)).write_text(ANSWER_RUNTIME)
+    return Web3(local_chain_provider([sender.address], artifacts))
+
+
+@allure.title("Batched reads are answered by the local chain")
+def test_batch_reads_local_chain(local_web3, sender):
+    batch = RpcBatch(local_web3)
+    batch.request('eth_call', [{'to': CONTRACT_ADDRESSES['KYCContract'], 'data': '0x'}, 'latest'], HexBytes)
+    batch.get_balance(sender.address)
+
+    answer, balance = batch.execute()
+
+    assert int.from_bytes(answer, 'big') == 42
+    assert balance == FUNDED_BALANCE
+
+
+@allure.title("Transaction details are collected on the local chain")
+def test_send_transaction_on_local_chain(local_web3, sender):
+    recipient = Account.create().address
+
+    result = send_transaction(local_web3, {'to': recipient, 'value': 1000}, sender, details=True,
+                              balances=[sender.address, recipient])
+
+    assert result.receipt['status'] == 1
+    assert result.balance_change(recipient) == 1000
+    assert result.balance_change(sender.address) == -1000 - result.fee
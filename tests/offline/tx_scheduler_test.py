@@ -0,0 +1,83 @@
+import allure
+import pytest
+from hexbytes import HexBytes
+from web3.exceptions import ContractLogicError
+
+from utils import tx_scheduler
+from utils.transaction_util import PendingTransaction
+from utils.tx_scheduler import TxScheduler
+
+
+class FakeChain:
+    def __init__(self, reverted=()):
+        self.reverted = set(reverted)
+        self.blocks = []
+
+    def submit(self, name):
+        return PendingTransaction(name, '0x0', 0)
+
+    def wait_all(self, web3, pending, timeout, on_receipt):
+        self.blocks.append(sorted(tx.tx_hash for tx in pending))
+        for tx in pending:
+            status = 0 if tx.tx_hash in self.reverted else 1
+            on_receipt(tx, {'status': status, 'transactionHash': HexBytes(tx.tx_hash.encode()), 'name': tx.tx_hash})
+
+
+@pytest.fixture
+def chain(monkeypatch):
+    chain = FakeChain()
+    monkeypatch.setattr(tx_scheduler, 'wait_all', chain.wait_all)
+    return chain
+
+
+@pytest.fixture
+def scheduler():
+    return TxScheduler(None)
+
+
+@allure.title("Independent chains of transactions share rounds")
+def test_independent_chains_share_rounds(chain, scheduler):
+    create_a = scheduler.add(lambda: chain.submit('create-a'))
+    create_b = scheduler.add(lambda: chain.submit('create-b'))
+    scheduler.add(lambda receipt: chain.submit('approve-' + receipt['name'][-1]), after=[create_a])
+    scheduler.add(lambda receipt: chain.submit('approve-' + receipt['name'][-1]), after=[create_b])
+
+    scheduler.run()
+
+    assert chain.blocks == [['create-a', 'create-b'], ['approve-a', 'approve-b']]
+    assert not scheduler
+
+
+@allure.title("Step waits for all of its parents and receives their receipts")
+def test_step_waits_for_all_parents(chain, scheduler):
+    first = scheduler.add(lambda: chain.submit('first'))
+    second = scheduler.add(lambda receipt: chain.submit('second'), after=[first])
+    received = []
+    scheduler.add(lambda *receipts: received.extend(receipt['name'] for receipt in receipts), after=[first, second])
+
+    scheduler.run()
+
+    assert chain.blocks == [['first'], ['second']]
+    assert received == ['first', 'second']
+
+
+@allure.title("Children of a step that sends nothing are released without its receipt")
+def test_step_without_transaction_releases_children(chain, scheduler):
+    granted = scheduler.add(lambda: None)
+    scheduler.add(lambda: chain.submit('create'), after=[granted])
+
+    receipts = scheduler.run()
+
+    assert chain.blocks == [['create']]
+    assert [receipt and receipt['name'] for receipt in receipts] == [None, 'create']
+
+
+@allure.title("Reverted step stops the run before its children are sent")
+def test_reverted_step_raises(chain, scheduler):
+    chain.reverted.add('create')
+    create = scheduler.add(lambda: chain.submit('create'))
+    scheduler.add(lambda receipt: chain.submit('approve'), after=[create])
+
+    with pytest.raises(ContractLogicError):
+        scheduler.run()
+    assert chain.blocks == [['create']]
@@ -0,0 +1,64 @@
+import logging
+
+import pytest
+from eth_account.signers.local import LocalAccount
+
+from contract.fee_contract import activate_account
+from utils.parallel import worker_name, is_parallel_worker, derive_worker_account
+from utils.process_lock import ProcessLock
+from utils.transaction_util import submit_transaction, wait_all, share_sender
+
+logger = logging.getLogger()
+
+
+@pytest.fixture(scope='session')
+def xdist_worker(request) -> str:
+    return worker_name(request.config)
+
+
+@pytest.fixture(scope='session')
+def process_locks(request, tmp_path_factory):
+    directory = tmp_path_factory.getbasetemp()
+    if is_parallel_worker(request.config):
+        directory = directory.parent
+    return {name: ProcessLock(directory, name) for name in ('alpha', 'contracts-admin', 'kyc-centre', 'global')}
+
+
+@pytest.fixture(scope='session', autouse=True)
+def shared_senders(request, process_locks, alpha_account, contracts_admin, kyc_centre_account):
+    if not is_parallel_worker(request.config):
+        return
+    # every worker signs with these genesis accounts, so each of their transactions reads the nonce under a lock
+    share_sender(alpha_account.address, process_locks['alpha'])
+    share_sender(contracts_admin.address, process_locks['contracts-admin'])
+    share_sender(kyc_centre_account.address, process_locks['kyc-centre'])
+
+
+@pytest.fixture(autouse=True)
+def global_state_lock(request, process_locks):
+    lock = process_locks['global']
+    with lock.exclusive() if request.node.get_closest_marker('serial') else lock.shared():
+        yield
+
+
+@pytest.fixture(scope='session')
+def funding_account(request, web3, fee_contract, alpha_account, shared_senders, xdist_worker) -> LocalAccount:
+    if not is_parallel_worker(request.config):
+        return alpha_account
+
+    funder = derive_worker_account(web3, alpha_account.key, xdist_worker)
+    funds = web3.toWei(request.config.getoption('--worker-funds'), 'ether')
+    logger.debug('WORKER FUNDER[{}, {}]'.format(xdist_worker, funder.address))
+    _top_up(web3, alpha_account, funder, funds)
+    activate_account(web3, funder)
+    return funder
+
+
+def _top_up(web3, from_account, to_account, funds):
+    if web3.eth.get_balance(to_account.address) >= funds // 2:
+        return
+    tx = {
+        'to': to_account.address,
+        'value': funds
+    }
+    wait_all(web3, [submit_transaction(web3, tx, from_account)])
@@ -0,0 +1,43 @@
+import logging
+
+import pytest
+
+from contract.fee_contract import submit_activation
+from contract.kyc_contract import submit_grant_kyc_centre_role, forget_request_indices
+from utils.chain_snapshot import ChainSnapshot, snapshots_supported
+from utils.parallel import is_parallel_worker
+from utils.transaction_util import wait_all
+
+logger = logging.getLogger()
+
+
+@pytest.fixture(scope='session')
+def chain_snapshot(request, web3, chain_params, call_cache, kyc_contract, account_pool, kyc_centre_account,
+                   contracts_admin):
+    if request.config.getoption('--snapshots') == 'off' or is_parallel_worker(request.config):
+        return None
+    if not snapshots_supported(web3):
+        logger.info('CHAIN SNAPSHOTS are not supported by the backend, state is not reverted between tests')
+        return None
+
+    account_pool.refill()
+    wait_all(web3, [
+        submit_activation(web3, kyc_centre_account),
+        submit_grant_kyc_centre_role(web3, kyc_centre_account, contracts_admin)
+    ])
+    pooled_accounts = account_pool.checkpoint()
+    snapshot = ChainSnapshot(web3, on_revert=[
+        chain_params.invalidate,
+        call_cache.invalidate,
+        forget_request_indices,
+        lambda: account_pool.restore(pooled_accounts)
+    ])
+    snapshot.take()
+    return snapshot
+
+
+@pytest.fixture(autouse=True)
+def revert_chain(chain_snapshot):
+    yield
+    if chain_snapshot is not None:
+        chain_snapshot.revert()
@@ -0,0 +1,32 @@
+import argparse
+import logging
+
+from web3 import Web3, HTTPProvider
+from web3.middleware import geth_poa_middleware
+
+from utils.http_session import pooled_session
+from utils.state_exporter import StateExporter, to_parquet
+
+
+def main():
+    parser = argparse.ArgumentParser(description='dump KYCContract state at one block to JSONL')
+    parser.add_argument('--node', default='http://localhost:8575')
+    parser.add_argument('--output', default='kyc-state.jsonl')
+    parser.add_argument('--block', type=int, help='block to pin every eth_call to (default: latest at start)')
+    parser.add_argument('--batch-size', type=int, default=200, help='eth_calls per JSON-RPC batch')
+    parser.add_argument('--workers', type=int, default=4, help='batches in flight at once')
+    parser.add_argument('--parquet', help='also convert the finished export to this Parquet file (needs pyarrow)')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(message)s')
+    web3 = Web3(HTTPProvider(args.node, request_kwargs={'timeout': 60}, session=pooled_session(pool_size=args.workers)))
+    web3.middleware_onion.inject(geth_poa_middleware, layer=0)
+    exporter = StateExporter(web3, args.output, args.block, args.batch_size, args.workers)
+    requests = exporter.run()
+    logging.info('exported {} requests at block {} to {}'.format(requests, exporter.block, args.output))
+    if args.parquet:
+        to_parquet(args.output, args.parquet)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,154 @@
+import argparse
+import json
+import keyword
+import re
+from pathlib import Path
+
+from eth_utils import function_abi_to_4byte_selector
+
+PACKAGE_DIR = Path(__file__).resolve().parent.parent
+ARTIFACTS_DIR = PACKAGE_DIR / 'artifacts'
+OUTPUT = PACKAGE_DIR / 'contract' / 'bindings.py'
+PYTHON_TYPES = {'address': 'str', 'bool': 'bool', 'string': 'str'}
+
+HEADER = '''\
+# Generated by tools/generate_bindings.py from artifacts/*.abi, do not edit.
+from dataclasses import dataclass
+from typing import Tuple
+
+from eth_abi import encode_abi, decode_abi
+from eth_utils import to_checksum_address
+'''
+
+
+def generate(artifacts_dir=ARTIFACTS_DIR) -> str:
+    structs = {}
+    contracts = []
+    for path in sorted(Path(artifacts_dir).glob('*.abi')):
+        abi = json.loads(path.read_text())
+        functions = [entry for entry in abi if entry['type'] == 'function']
+        for entry in functions:
+            for output in entry['outputs']:
+                if output['type'] == 'tuple':
+                    structs.setdefault(_struct_name(output), output['components'])
+        contracts.append(_contract_class(path.stem, functions))
+
+    sections = [HEADER] + [_struct_class(name, components) for name, components in sorted(structs.items())] + contracts
+    return '\n\n'.join(sections)
+
+
+def _struct_class(name, components) -> str:
+    fields = [component['name'] for component in components]
+    lines = [
+        '@dataclass',
+        'class {}:'.format(name),
+        '    __slots__ = {!r}'.format(tuple(fields)),
+    ]
+    lines += ['    {}: {}'.format(field, _python_type(component)) for field, component in zip(fields, components)]
+    lines += [
+        '',
+        '    @classmethod',
+        "    def from_tuple(cls, values) -> '{}':".format(name),
+        '        return cls(',
+    ]
+    lines += ['            {}={},'.format(field, _normalized(component, 'values[{}]'.format(i)))
+              for i, (field, component) in enumerate(zip(fields, components))]
+    lines += [
+        '        )',
+        '',
+        '    def __getitem__(self, key):',
+        '        return getattr(self, key)',
+        '',
+    ]
+    return '\n'.join(lines)
+
+
+def _contract_class(name, functions) -> str:
+    methods = []
+    for entry in functions:
+        methods.append(_encoder(entry))
+        if entry['outputs']:
+            methods.append(_decoder(entry))
+    return 'class {}:\n'.format(name) + '\n\n'.join('\n'.join(method) for method in methods) + '\n'
+
+
+def _encoder(entry) -> list:
+    selector = '0x' + function_abi_to_4byte_selector(entry).hex()
+    names = _argument_names(entry['inputs'])
+    signature = ', '.join('{}: {}'.format(name, _python_type(argument))
+                          for name, argument in zip(names, entry['inputs']))
+    if not entry['inputs']:
+        body = '        return {!r}'.format(selector)
+    else:
+        body = '        return {!r} + encode_abi({!r}, [{}]).hex()'.format(
+            selector, [_abi_type(argument) for argument in entry['inputs']], ', '.join(names))
+    return ['    @staticmethod', '    def {}({}) -> str:'.format(entry['name'], signature), body]
+
+
+def _decoder(entry) -> list:
+    outputs = entry['outputs']
+    values = [_normalized(output, 'values[{}]'.format(i)) for i, output in enumerate(outputs)]
+    if len(outputs) == 1:
+        returns, result = _python_type(outputs[0]), values[0]
+    else:
+        returns = 'Tuple[{}]'.format(', '.join(_python_type(output) for output in outputs))
+        result = '(\n            {},\n        )'.format(',\n            '.join(values))
+    return [
+        '    @staticmethod',
+        '    def decode_{}(data: bytes) -> {}:'.format(entry['name'], returns),
+        '        values = decode_abi({!r}, data)'.format([_abi_type(output) for output in outputs]),
+        '        return {}'.format(result),
+    ]
+
+
+def _argument_names(arguments) -> list:
+    names = []
+    for i, argument in enumerate(arguments):
+        name = argument['name'] or 'arg{}'.format(i)
+        names.append(name + '_' if keyword.iskeyword(name) else name)
+    return names
+
+
+def _abi_type(argument) -> str:
+    if argument['type'].startswith('tuple'):
+        return '({}){}'.format(','.join(_abi_type(component) for component in argument['components']),
+                               argument['type'][len('tuple'):])
+    return argument['type']
+
+
+def _python_type(argument) -> str:
+    abi_type = argument['type']
+    if abi_type == 'tuple':
+        return _struct_name(argument)
+    if abi_type.endswith(']'):
+        return 'list'
+    if abi_type.startswith(('uint', 'int')):
+        return 'int'
+    if abi_type.startswith('bytes'):
+        return 'bytes'
+    return PYTHON_TYPES[abi_type]
+
+
+def _normalized(argument, expression) -> str:
+    if argument['type'] == 'tuple':
+        return '{}.from_tuple({})'.format(_struct_name(argument), expression)
+    if argument['type'] == 'address':
+        return 'to_checksum_address({})'.format(expression)
+    return expression
+
+
+def _struct_name(argument) -> str:
+    return re.sub(r'^struct\s+(\w+\.)?', '', argument['internalType'])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='generate typed contract bindings from artifacts/*.abi')
+    parser.add_argument('--artifacts', default=str(ARTIFACTS_DIR))
+    parser.add_argument('--output', default=str(OUTPUT))
+    args = parser.parse_args()
+
+    Path(args.output).write_text(generate(args.artifacts))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,36 @@
+import argparse
+import json
+import logging
+
+from web3 import Web3, HTTPProvider
+from web3.middleware import geth_poa_middleware
+
+from utils.event_indexer import EventIndexer
+from utils.http_session import pooled_session
+
+
+def main():
+    parser = argparse.ArgumentParser(description='index KYCContract events into a local SQLite database')
+    parser.add_argument('--node', default='http://localhost:8575')
+    parser.add_argument('--db', default='kyc-events.sqlite')
+    parser.add_argument('--start-block', type=int, default=0, help='first block to index on an empty database')
+    parser.add_argument('--chunk-size', type=int, default=2_000, help='blocks per eth_getLogs request')
+    parser.add_argument('--confirmations', type=int, default=0, help='stay this many blocks behind the head')
+    parser.add_argument('--user', help='print the indexed requests of this address after catching up')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(message)s')
+    web3 = Web3(HTTPProvider(args.node, request_kwargs={'timeout': 30}, session=pooled_session()))
+    web3.middleware_onion.inject(geth_poa_middleware, layer=0)
+    indexer = EventIndexer(web3, args.db, args.start_block, args.chunk_size, args.confirmations)
+    try:
+        indexed = indexer.catch_up()
+        logging.info('indexed {} events, up to block {}'.format(indexed, indexer.last_block))
+        if args.user:
+            print(json.dumps(indexer.user_requests(args.user), indent=2))
+    finally:
+        indexer.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,36 @@
+import itertools
+import threading
+from functools import lru_cache
+
+from eth_account import Account
+from eth_account.hdaccount import generate_mnemonic, seed_from_mnemonic, key_from_seed
+from eth_account.signers.local import LocalAccount
+
+ACCOUNT_PATH = "m/44'/60'/{namespace}'/0/{index}"
+
+
+def new_mnemonic() -> str:
+    return generate_mnemonic(12, 'english')
+
+
+@lru_cache(maxsize=None)
+def mnemonic_seed(mnemonic: str) -> bytes:
+    # PBKDF2 runs once per mnemonic, however many namespaces derive from it
+    return seed_from_mnemonic(mnemonic, '')
+
+
+class AccountFactory:
+    def __init__(self, mnemonic: str, namespace=0):
+        self.mnemonic = mnemonic
+        self.namespace = namespace
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+
+    def next_account(self) -> LocalAccount:
+        with self._lock:
+            index = next(self._counter)
+        return self.account(index)
+
+    def account(self, index) -> LocalAccount:
+        path = ACCOUNT_PATH.format(namespace=self.namespace, index=index)
+        return Account.from_key(key_from_seed(mnemonic_seed(self.mnemonic), path))
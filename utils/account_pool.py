@@ -0,0 +1,90 @@
+import logging
+import threading
+from collections import deque
+
+from eth_account.signers.local import LocalAccount
+
+from contract.fee_contract import activation_transaction, get_initial_fee, get_paid_fees
+from utils.transaction_util import submit_transactions, wait_all
+
+logger = logging.getLogger()
+
+MINT_ATTEMPTS = 3
+
+
+class AccountPool:
+    def __init__(self, web3, funder: LocalAccount, size=16, refill_threshold=0, funds=None, account_factory=None):
+        self.web3 = web3
+        self.funder = funder
+        self.account_factory = account_factory
+        self.size = size
+        self.refill_threshold = refill_threshold
+        self.funds = funds if funds is not None else web3.toWei(1, 'ether')
+        self._accounts = deque()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._accounts)
+
+    def acquire(self) -> LocalAccount:
+        with self._lock:
+            if len(self._accounts) <= self.refill_threshold:
+                self._refill()
+            return self._accounts.popleft()
+
+    def refill(self):
+        with self._lock:
+            self._refill()
+
+    def checkpoint(self):
+        with self._lock:
+            return list(self._accounts)
+
+    def restore(self, accounts):
+        with self._lock:
+            self._accounts = deque(accounts)
+
+    def _refill(self):
+        requested = self.size - len(self._accounts)
+        minted = 0
+        for _ in range(MINT_ATTEMPTS):
+            missing = self.size - len(self._accounts)
+            if missing <= 0:
+                return
+            accounts = self._mint(missing)
+            minted += len(accounts)
+            self._accounts.extend(accounts)
+        if not self._accounts:
+            raise RuntimeError('ACCOUNT POOL minted {} of {} requested accounts in {} attempts'.format(
+                minted, requested, MINT_ATTEMPTS))
+
+    def _mint(self, count):
+        accounts = [self._new_account() for _ in range(count)]
+        for account in accounts:
+            logger.debug('ACCOUNT[{}, {}]'.format(account.address, account.privateKey.hex()))
+
+        transfers = [(self._funds_transaction(account), self.funder) for account in accounts]
+        funded = self._successful(accounts, wait_all(self.web3, submit_transactions(self.web3, transfers)))
+        # accounts derived from a reused mnemonic may have paid the fee in an earlier run
+        inactive = [account for account, paid in zip(funded, get_paid_fees(self.web3, funded)) if not paid]
+        fee = get_initial_fee() if inactive else None
+        activations = [(activation_transaction(account, fee), account) for account in inactive]
+        pending = {tx.sender: tx for tx in submit_transactions(self.web3, activations)}
+        active = self._successful(funded, wait_all(self.web3, [pending.get(account.address) for account in funded]))
+        logger.debug('ACCOUNT POOL minted {} of {} accounts'.format(len(active), count))
+        return active
+
+    def _new_account(self) -> LocalAccount:
+        if self.account_factory is not None:
+            return self.account_factory.next_account()
+        return self.web3.eth.account.create()
+
+    def _funds_transaction(self, account):
+        return {
+            'to': account.address,
+            'value': self.funds
+        }
+
+    @staticmethod
+    def _successful(accounts, receipts):
+        return [account for account, receipt in zip(accounts, receipts) if receipt is None or receipt['status'] == 1]
@@ -1,32 +1,88 @@
+import hashlib
 import logging
 
 import pytest
 
-from contract.fee_contract import activate_account
-from utils.transaction_util import send_transaction
+from utils.account_factory import AccountFactory, new_mnemonic
+from utils.account_pool import AccountPool
+from utils.parallel import worker_name, MASTER
+from utils.rpc_cassette import cassette_library
+from utils.transaction_util import submit_transaction, wait_all
 
 logger = logging.getLogger()
 
+ALPHA_KEY = '16bd6f1fafed1f1f1ae9d27db97064589be7207946735225782f5726f4195f85'
+CONTRACTS_ADMIN_KEY = '4f3432f05f0f66fc2ba987acc522499ee29bc20201617a54cc5f992549a3ce65'
+KYC_CENTRE_KEY = 'ed4c65f1bf6c622f5954ff39932c192b26a963abcc65d56f9487d4cabe9301f1'
+
+
+def pytest_configure(config):
+    mnemonic = getattr(config, 'workerinput', {}).get('account_mnemonic')
+    config.account_mnemonic = mnemonic or config.getoption('--account-mnemonic') or new_mnemonic()
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    node.workerinput['account_mnemonic'] = node.config.account_mnemonic
+
+
+def pytest_report_header(config):
+    return 'accounts: --account-mnemonic "{}"'.format(config.account_mnemonic)
+
+
+@pytest.fixture(scope='session')
+def account_factory(request):
+    worker = worker_name(request.config)
+    namespace = 0 if worker == MASTER else int(worker.lstrip('gw')) + 1
+    logger.info('ACCOUNT FACTORY[{}, {}]'.format(worker, request.config.account_mnemonic))
+    return AccountFactory(request.config.account_mnemonic, namespace)
+
+
+@pytest.fixture
+def test_account_factory(request, account_factory):
+    if not cassette_library().active:
+        return account_factory
+    # cassettes are replayed per test, so a test must get the same accounts whatever ran before it
+    namespace = int(hashlib.sha256(request.node.nodeid.encode()).hexdigest()[:7], 16)
+    return AccountFactory(request.config.account_mnemonic, namespace)
+
 
 @pytest.fixture
-def random_account(web3, alpha_account):
-    account = web3.eth.account.create()
+def random_account(web3, funding_account, test_account_factory):
+    account = test_account_factory.next_account()
     logger.debug('ACCOUNT[{}, {}]'.format(account.address, account.privateKey.hex()))
 
-    send_funds(web3, alpha_account, account)
+    send_funds(web3, funding_account, account)
     return account
 
 
+@pytest.fixture(scope='session')
+def account_pool(request, web3, fee_contract, funding_account, account_factory):
+    return AccountPool(web3, funding_account,
+                       size=request.config.getoption('--account-pool-size'),
+                       refill_threshold=request.config.getoption('--account-pool-refill'),
+                       account_factory=account_factory)
+
+
 @pytest.fixture
-def active_account(web3, fee_contract, random_account):
-    account = random_account
-    activate_account(web3, account)
-    return account
+def test_account_pool(web3, funding_account, account_pool, test_account_factory):
+    if not cassette_library().active:
+        return account_pool
+    return AccountPool(web3, funding_account, size=1, account_factory=test_account_factory)
+
+
+@pytest.fixture
+def active_account(test_account_pool):
+    return test_account_pool.acquire()
 
 
 def send_funds(web3, from_account, to_account):
+    wait_all(web3, [submit_funds(web3, from_account, to_account)])
+
+
+def submit_funds(web3, from_account, to_account):
     tx = {
         'to': to_account.address,
         'value': web3.toWei(1, 'ether')
     }
-    send_transaction(web3, tx, from_account)
+    return submit_transaction(web3, tx, from_account)
@@ -0,0 +1,13 @@
+from utils.async_transaction_util import submit_transaction, wait_all
+
+
+async def send_funds(web3, from_account, to_account):
+    await wait_all(web3, [await submit_funds(web3, from_account, to_account)])
+
+
+async def submit_funds(web3, from_account, to_account):
+    tx = {
+        'to': to_account.address,
+        'value': web3.toWei(1, 'ether')
+    }
+    return await submit_transaction(web3, tx, from_account)
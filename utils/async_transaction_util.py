@@ -0,0 +1,147 @@
+import asyncio
+import time
+from typing import List, Iterable, Optional
+
+from eth_account import Account
+from eth_account.signers.local import LocalAccount
+from hexbytes import HexBytes
+from web3 import Web3, AsyncHTTPProvider
+from web3._utils.abi import get_abi_output_types, map_abi_data
+from web3._utils.normalizers import BASE_RETURN_NORMALIZERS
+from web3.contract import Contract
+from web3.eth import AsyncEth
+from web3.exceptions import ContractLogicError, TransactionNotFound, TimeExhausted
+from web3.types import TxParams, TxReceipt
+
+from utils.nonce_manager import NonceManager, is_nonce_error, is_known_transaction_error
+from utils.transaction_util import PendingTransaction, NONCE_RETRIES, RECEIPT_TIMEOUT, function_selector
+
+GAS_PRICE_TTL = 1.0
+MIN_POLL_INTERVAL = 0.1
+MAX_POLL_INTERVAL = 1.0
+
+_nonce_manager = NonceManager()
+_chain_ids = {}
+_gas_prices = {}
+
+
+def async_web3(node, timeout=10) -> Web3:
+    return Web3(AsyncHTTPProvider(node, request_kwargs={'timeout': timeout}),
+                modules={'eth': (AsyncEth,)}, middlewares=[])
+
+
+async def send_transaction(web3: Web3, transaction: TxParams, sender: LocalAccount):
+    pending = await submit_transaction(web3, transaction, sender)
+    await wait_all(web3, [pending])
+    return pending.tx_hash
+
+
+async def transact(web3: Web3, transaction: TxParams, sender: LocalAccount) -> TxReceipt:
+    receipt = (await wait_all(web3, [await submit_transaction(web3, transaction, sender)]))[0]
+    if receipt['status'] != 1:
+        raise ContractLogicError('execution reverted: {} in {}'.format(function_selector(transaction),
+                                                                        receipt['transactionHash'].hex()))
+    return receipt
+
+
+async def submit_transaction(web3: Web3, transaction: TxParams, sender: LocalAccount) -> PendingTransaction:
+    transaction['gas'] = 300_000
+    transaction['gasPrice'] = await _gas_price(web3)
+    transaction['chainId'] = await _chain_id(web3)
+    tx_hash = await _send_signed(web3, transaction, sender)
+    return PendingTransaction(tx_hash, sender.address, transaction['nonce'], transaction.get('to'),
+                              function_selector(transaction))
+
+
+async def wait_all(web3: Web3, pending: Iterable[Optional[PendingTransaction]],
+                   timeout=RECEIPT_TIMEOUT) -> List[Optional[TxReceipt]]:
+    pending = list(pending)
+    missing = {tx.tx_hash for tx in pending if tx is not None}
+    receipts = {}
+    interval = MIN_POLL_INTERVAL
+    deadline = time.monotonic() + timeout
+    while missing:
+        found = await asyncio.gather(*(_receipt(web3, tx_hash) for tx_hash in missing))
+        for tx_hash, receipt in zip(list(missing), found):
+            if receipt is not None:
+                receipts[tx_hash] = receipt
+        missing -= set(receipts)
+        if not missing:
+            break
+        if time.monotonic() > deadline:
+            raise TimeExhausted('Transactions {} are not in the chain after {} seconds'.format(missing, timeout))
+        await asyncio.sleep(interval)
+        interval = min(interval * 1.5, MAX_POLL_INTERVAL)
+    return [receipts[tx.tx_hash] if tx is not None else None for tx in pending]
+
+
+def build_transaction(contract: Contract, fn_name, args=(), sender: LocalAccount = None, value=0) -> TxParams:
+    tx = {
+        'to': contract.address,
+        'data': contract.encodeABI(fn_name=fn_name, args=list(args)),
+        'value': value
+    }
+    if sender is not None:
+        tx['from'] = sender.address
+    return tx
+
+
+async def call(web3: Web3, contract: Contract, fn_name, args=(), address=None):
+    tx = {
+        'to': contract.address,
+        'data': contract.encodeABI(fn_name=fn_name, args=list(args))
+    }
+    if address is not None:
+        tx['from'] = address
+    output_types = get_abi_output_types(contract.get_function_by_name(fn_name).abi)
+    decoded = web3.codec.decode_abi(output_types, HexBytes(await web3.eth.call(tx)))
+    normalized = map_abi_data(BASE_RETURN_NORMALIZERS, output_types, decoded)
+    return normalized[0] if len(normalized) == 1 else normalized
+
+
+async def _receipt(web3: Web3, tx_hash):
+    try:
+        return await web3.eth.get_transaction_receipt(tx_hash)
+    except TransactionNotFound:
+        return None
+
+
+async def _send_signed(web3: Web3, transaction: TxParams, sender: LocalAccount, retries=NONCE_RETRIES):
+    transaction['nonce'] = await _nonce(web3, sender)
+    signed_tx = Account.sign_transaction(transaction, sender.privateKey)
+    tx_hash = signed_tx['hash'].hex()
+    try:
+        await web3.eth.send_raw_transaction(signed_tx.rawTransaction)
+    except ValueError as error:
+        _nonce_manager.reset(sender.address)
+        if is_known_transaction_error(error):
+            return tx_hash
+        if is_nonce_error(error) and retries > 0:
+            return await _send_signed(web3, transaction, sender, retries - 1)
+        raise
+    return tx_hash
+
+
+async def _nonce(web3: Web3, sender: LocalAccount):
+    if not _nonce_manager.is_synced(sender.address):
+        _nonce_manager.seed(sender.address, await web3.eth.get_transaction_count(sender.address, 'pending'))
+    return _nonce_manager.take(sender.address)
+
+
+async def _chain_id(web3: Web3):
+    key = web3.provider.endpoint_uri
+    if key not in _chain_ids:
+        _chain_ids[key] = await web3.eth.chain_id
+    return _chain_ids[key]
+
+
+async def _gas_price(web3: Web3):
+    key = web3.provider.endpoint_uri
+    cached = _gas_prices.get(key)
+    if cached is None or time.monotonic() - cached[1] > GAS_PRICE_TTL:
+        cached = _gas_prices[key] = (await web3.eth.gas_price, time.monotonic())
+    return cached[0]
+
+
+def reset_nonces(address: str = None):
+    _nonce_manager.reset(address)
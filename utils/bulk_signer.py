@@ -0,0 +1,43 @@
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, NamedTuple, Tuple
+
+from eth_account import Account
+from eth_account.signers.local import LocalAccount
+from web3.types import TxParams
+
+MIN_PARALLEL = 16
+
+_executors: Dict[int, ProcessPoolExecutor] = {}
+_executors_lock = threading.Lock()
+
+
+class SignedRawTransaction(NamedTuple):
+    raw_transaction: bytes
+    tx_hash: str
+
+
+def sign_transactions(pairs: List[Tuple[TxParams, LocalAccount]], processes=None,
+                      min_parallel=MIN_PARALLEL) -> List[SignedRawTransaction]:
+    items = [(dict(tx), bytes(account.key)) for tx, account in pairs]
+    if len(items) < min_parallel:
+        return [_sign(item) for item in items]
+
+    processes = processes or os.cpu_count() or 1
+    chunksize = max(1, len(items) // (processes * 4))
+    return list(_executor(processes).map(_sign, items, chunksize=chunksize))
+
+
+def _executor(processes) -> ProcessPoolExecutor:
+    # the pool outlives a single batch, so only the first bulk signing pays for starting the processes
+    with _executors_lock:
+        if processes not in _executors:
+            _executors[processes] = ProcessPoolExecutor(max_workers=processes)
+        return _executors[processes]
+
+
+def _sign(item) -> SignedRawTransaction:
+    tx, key = item
+    signed = Account.sign_transaction(tx, key)
+    return SignedRawTransaction(bytes(signed.rawTransaction), signed.hash.hex())
@@ -0,0 +1,89 @@
+import threading
+import time
+from collections import Counter
+
+import rlp
+from eth_utils import to_checksum_address, to_int
+from hexbytes import HexBytes
+
+LATEST = 'latest'
+
+
+class CallCache:
+    def __init__(self, max_age=1.0):
+        self.max_age = max_age
+        self.saved_rpcs = Counter()
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._block = None
+
+    def middleware(self, make_request, web3):
+        def call_cache_middleware(method, params):
+            if method == 'eth_call' and self.max_age > 0:
+                return self._cached_call(make_request, method, params)
+            if method == 'eth_sendRawTransaction':
+                self.invalidate_contract(_recipient(params[0]))
+            response = make_request(method, params)
+            if method == 'eth_blockNumber' and 'result' in response:
+                result = response['result']
+                self.observe_block(result if isinstance(result, int) else to_int(hexstr=result))
+            return response
+
+        return call_cache_middleware
+
+    def observe_block(self, number):
+        with self._lock:
+            if self._block is None or number > self._block:
+                self._block = number
+                self._entries = {key: entry for key, entry in self._entries.items()
+                                 if not entry[2] or key[0][1] >= number}
+
+    def observe_receipt(self, pending, receipt):
+        self.observe_block(receipt['blockNumber'])
+
+    def invalidate_contract(self, address):
+        with self._lock:
+            if address is None:
+                self._entries.clear()
+            else:
+                self._entries = {key: entry for key, entry in self._entries.items() if key[1] != address}
+
+    def invalidate(self):
+        with self._lock:
+            self._entries.clear()
+            self._block = None
+
+    def _cached_call(self, make_request, method, params):
+        key = self._key(params)
+        if key is None:
+            return make_request(method, params)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (not entry[2] or time.monotonic() - entry[1] <= self.max_age):
+                self.saved_rpcs[method] += 1
+                return entry[0]
+        response = make_request(method, params)
+        if 'result' in response:
+            with self._lock:
+                self._entries[key] = (response, time.monotonic(), isinstance(key[0], tuple))
+        return response
+
+    def _key(self, params):
+        call = params[0]
+        block = params[1] if len(params) > 1 else LATEST
+        if block == 'pending' or 'to' not in call:
+            return None
+        if block == LATEST:
+            with self._lock:
+                if self._block is None:
+                    return None
+                block = (LATEST, self._block)
+        return (block, to_checksum_address(call['to']), call.get('data'), call.get('from'))
+
+
+def _recipient(raw_transaction):
+    try:
+        fields = rlp.decode(bytes(HexBytes(raw_transaction)))
+        return to_checksum_address(fields[3]) if fields[3] else None
+    except Exception:
+        return None
@@ -0,0 +1,75 @@
+import threading
+import time
+from collections import Counter
+
+PER_BLOCK = 'block'
+
+
+class ChainParameters:
+    def __init__(self, gas_price_refresh=PER_BLOCK):
+        self.gas_price_refresh = gas_price_refresh
+        self.saved_rpcs = Counter()
+        self._lock = threading.Lock()
+        self._chain_id = None
+        self._gas_price = None
+        self._gas_price_fetched_at = 0.0
+        self._block = None
+
+    def middleware(self, make_request, web3):
+        def chain_params_middleware(method, params):
+            if method == 'eth_chainId':
+                return self._cached_chain_id(make_request, method, params)
+            if method == 'eth_gasPrice':
+                return self._cached_gas_price(make_request, method, params)
+            return make_request(method, params)
+
+        return chain_params_middleware
+
+    def observe_block(self, number):
+        with self._lock:
+            if self._block is not None and number > self._block and self.gas_price_refresh == PER_BLOCK:
+                self._gas_price = None
+            if self._block is None or number > self._block:
+                self._block = number
+
+    def observe_receipt(self, pending, receipt):
+        self.observe_block(receipt['blockNumber'])
+
+    def invalidate(self):
+        with self._lock:
+            self._gas_price = None
+            self._block = None
+
+    def _cached_chain_id(self, make_request, method, params):
+        with self._lock:
+            if self._chain_id is not None:
+                self.saved_rpcs[method] += 1
+                return self._chain_id
+        response = make_request(method, params)
+        if 'result' in response:
+            with self._lock:
+                self._chain_id = response
+        return response
+
+    def _cached_gas_price(self, make_request, method, params):
+        with self._lock:
+            if self._gas_price is not None and not self._gas_price_expired():
+                self.saved_rpcs[method] += 1
+                return self._gas_price
+        response = make_request(method, params)
+        if 'result' in response:
+            with self._lock:
+                self._gas_price = response
+                self._gas_price_fetched_at = time.monotonic()
+        return response
+
+    def _gas_price_expired(self):
+        if self.gas_price_refresh == PER_BLOCK:
+            return False
+        return time.monotonic() - self._gas_price_fetched_at > self.gas_price_refresh
+
+
+def parse_gas_price_refresh(value):
+    if value == PER_BLOCK:
+        return PER_BLOCK
+    return float(value)
@@ -0,0 +1,30 @@
+from typing import Callable, List
+
+from web3 import Web3
+
+from utils.transaction_util import reset_nonces
+
+
+class ChainSnapshot:
+    def __init__(self, web3: Web3, on_revert: List[Callable[[], None]] = None):
+        self.web3 = web3
+        self.on_revert = list(on_revert or [])
+        self._snapshot_id = None
+
+    def take(self):
+        self._snapshot_id = self.web3.testing.snapshot()
+
+    def revert(self):
+        self.web3.testing.revert(self._snapshot_id)
+        self.take()
+        reset_nonces()
+        for callback in self.on_revert:
+            callback()
+
+
+def snapshots_supported(web3: Web3) -> bool:
+    try:
+        web3.testing.revert(web3.testing.snapshot())
+    except ValueError:
+        return False
+    return True
@@ -0,0 +1,97 @@
+import hashlib
+import json
+import os
+import pickle
+import threading
+import weakref
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List
+
+from eth_utils import function_abi_to_4byte_selector, event_abi_to_log_topic, to_checksum_address
+from web3 import Web3
+from web3.contract import Contract
+
+ARTIFACTS_DIR = Path(__file__).resolve().parent.parent / 'artifacts'
+CACHE_DIR = Path(__file__).resolve().parent.parent / '.contract-cache'
+CONTRACT_ADDRESSES = {
+    'FeeContract': '0x0000000000000000000000000000000000001000',
+    'KYCContract': '0x0000000000000000000000000000000000001001',
+    'FilterContract': '0x0000000000000000000000000000000000001002',
+}
+
+
+@dataclass(frozen=True)
+class ContractArtifact:
+    name: str
+    address: str
+    abi: List[dict]
+    selectors: Dict[str, str]
+    topics: Dict[str, str]
+
+
+_artifacts: Dict[str, ContractArtifact] = {}
+_contracts = weakref.WeakKeyDictionary()
+_lock = threading.Lock()
+
+
+def artifact(name) -> ContractArtifact:
+    with _lock:
+        if name not in _artifacts:
+            _artifacts[name] = _load(name)
+        return _artifacts[name]
+
+
+def artifacts() -> Dict[str, ContractArtifact]:
+    return {name: artifact(name) for name in CONTRACT_ADDRESSES}
+
+
+def event_abis() -> Dict[str, dict]:
+    return {
+        entry.topics[abi['name']]: abi
+        for entry in artifacts().values()
+        for abi in entry.abi if abi['type'] == 'event'
+    }
+
+
+def contract(web3: Web3, name) -> Contract:
+    with _lock:
+        contracts = _contracts.setdefault(web3, {})
+    if name not in contracts:
+        entry = artifact(name)
+        contracts[name] = web3.eth.contract(abi=entry.abi, address=entry.address)
+    return contracts[name]
+
+
+def offline_contract(name) -> Contract:
+    entry = artifact(name)
+    return Web3().eth.contract(abi=entry.abi, address=entry.address)
+
+
+def _load(name) -> ContractArtifact:
+    source = (ARTIFACTS_DIR / '{}.abi'.format(name)).read_bytes()
+    cache = CACHE_DIR / '{}-{}.pickle'.format(name, hashlib.sha256(source).hexdigest()[:16])
+    if cache.exists():
+        with open(cache, 'rb') as f:
+            return pickle.load(f)
+
+    entry = _build(name, source)
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    partial = cache.with_suffix('.{}.tmp'.format(os.getpid()))
+    with open(partial, 'wb') as f:
+        pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+    partial.replace(cache)
+    return entry
+
+
+def _build(name, source: bytes) -> ContractArtifact:
+    abi = json.loads(source)
+    return ContractArtifact(
+        name=name,
+        address=to_checksum_address(CONTRACT_ADDRESSES[name]),
+        abi=abi,
+        selectors={entry['name']: '0x' + function_abi_to_4byte_selector(entry).hex()
+                   for entry in abi if entry['type'] == 'function'},
+        topics={entry['name']: '0x' + event_abi_to_log_topic(entry).hex()
+                for entry in abi if entry['type'] == 'event'},
+    )
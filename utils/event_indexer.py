@@ -0,0 +1,177 @@
+import logging
+import sqlite3
+from pathlib import Path
+from typing import List
+
+from eth_utils import to_checksum_address, to_hex
+from hexbytes import HexBytes
+from web3 import Web3
+
+from contract.bindings import KYCContract
+from utils import contract_registry
+from utils.rpc_batch import RpcBatch
+
+logger = logging.getLogger()
+
+CHUNK_SIZE = 2_000
+REQUEST_STATES = {
+    'RequestCreated': 'created',
+    'RequestApproved': 'approved',
+    'RequestDeclined': 'declined',
+    'RequestWithdrawn': 'withdrawn',
+}
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER NOT NULL);
+CREATE TABLE IF NOT EXISTS requests (
+    request_index INTEGER PRIMARY KEY,
+    user TEXT NOT NULL,
+    centre TEXT NOT NULL,
+    level INTEGER NOT NULL,
+    deposit TEXT NOT NULL,
+    state TEXT NOT NULL,
+    created_block INTEGER NOT NULL,
+    updated_block INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS requests_user ON requests (user);
+CREATE INDEX IF NOT EXISTS requests_centre ON requests (centre);
+CREATE TABLE IF NOT EXISTS events (
+    block_number INTEGER NOT NULL,
+    log_index INTEGER NOT NULL,
+    tx_hash TEXT NOT NULL,
+    event TEXT NOT NULL,
+    request_index INTEGER,
+    account TEXT,
+    role TEXT,
+    level INTEGER,
+    PRIMARY KEY (block_number, log_index)
+);
+CREATE INDEX IF NOT EXISTS events_request ON events (request_index);
+CREATE INDEX IF NOT EXISTS events_account ON events (account);
+'''
+
+
+class EventIndexer:
+    def __init__(self, web3: Web3, path, start_block=0, chunk_size=CHUNK_SIZE, confirmations=0):
+        self.web3 = web3
+        self.start_block = start_block
+        self.chunk_size = chunk_size
+        self.confirmations = confirmations
+        self.artifact = contract_registry.artifact('KYCContract')
+        self._events = {topic: name for name, topic in self.artifact.topics.items()}
+        self._db = sqlite3.connect(str(Path(path)))
+        self._db.executescript(SCHEMA)
+
+    def close(self):
+        self._db.close()
+
+    @property
+    def last_block(self) -> int:
+        row = self._db.execute("SELECT value FROM meta WHERE key = 'last_block'").fetchone()
+        return row[0] if row else self.start_block - 1
+
+    def catch_up(self) -> int:
+        head = self.web3.eth.block_number - self.confirmations
+        indexed = 0
+        from_block = self.last_block + 1
+        chunk_size = self.chunk_size
+        while from_block <= head:
+            to_block = min(from_block + chunk_size - 1, head)
+            try:
+                logs = self._logs(from_block, to_block)
+            except ValueError as error:
+                if chunk_size == 1:
+                    raise
+                chunk_size = max(chunk_size // 2, 1)
+                logger.debug('INDEXER[getLogs {}-{} failed, chunk size {}: {}]'.format(
+                    from_block, to_block, chunk_size, error))
+                continue
+            self._store(logs, to_block)
+            indexed += len(logs)
+            from_block = to_block + 1
+        logger.debug('INDEXER[{} events, indexed up to block {}]'.format(indexed, self.last_block))
+        return indexed
+
+    def user_requests(self, user) -> List[dict]:
+        return self._rows('SELECT * FROM requests WHERE user = ? ORDER BY request_index', to_checksum_address(user))
+
+    def centre_requests(self, centre) -> List[dict]:
+        return self._rows('SELECT * FROM requests WHERE centre = ? ORDER BY request_index',
+                          to_checksum_address(centre))
+
+    def request_history(self, request_index) -> List[dict]:
+        return self._rows('SELECT * FROM events WHERE request_index = ? ORDER BY block_number, log_index',
+                          request_index)
+
+    def account_events(self, account) -> List[dict]:
+        return self._rows('SELECT * FROM events WHERE account = ? ORDER BY block_number, log_index',
+                          to_checksum_address(account))
+
+    def _logs(self, from_block, to_block):
+        return self.web3.eth.get_logs({
+            'address': self.artifact.address,
+            'fromBlock': from_block,
+            'toBlock': to_block,
+            'topics': [list(self._events)],
+        })
+
+    def _store(self, logs, to_block):
+        events = [self._decode(log) for log in logs]
+        created = [event for event in events if event['event'] == 'RequestCreated']
+        requests = self._lookup_requests([event['request_index'] for event in created])
+        with self._db:
+            for event in created:
+                user, _, level, _, centre, deposit = requests[event['request_index']]
+                self._db.execute(
+                    'INSERT OR REPLACE INTO requests VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                    (event['request_index'], user, centre, level, str(deposit), 'created', event['block_number'],
+                     event['block_number']))
+            for event in events:
+                if event['event'] in REQUEST_STATES and event['event'] != 'RequestCreated':
+                    self._db.execute('UPDATE requests SET state = ?, updated_block = ? WHERE request_index = ?',
+                                     (REQUEST_STATES[event['event']], event['block_number'], event['request_index']))
+            self._db.executemany(
+                'INSERT OR REPLACE INTO events VALUES '
+                '(:block_number, :log_index, :tx_hash, :event, :request_index, :account, :role, :level)', events)
+            self._db.execute("INSERT OR REPLACE INTO meta VALUES ('last_block', ?)", (to_block,))
+
+    def _lookup_requests(self, indices):
+        # user, level, centre and deposit never change after creation, so 'latest' works on non-archive nodes
+        batch = RpcBatch(self.web3)
+        for index in indices:
+            batch.request('eth_call', [{'to': self.artifact.address, 'data': KYCContract.kycRequests(index)}, 'latest'],
+                          lambda result: KYCContract.decode_kycRequests(HexBytes(result)))
+        return dict(zip(indices, batch.execute()))
+
+    def _decode(self, log) -> dict:
+        topics = [to_hex(topic) for topic in log['topics']]
+        name = self._events[topics[0]]
+        event = {
+            'block_number': log['blockNumber'],
+            'log_index': log['logIndex'],
+            'tx_hash': to_hex(log['transactionHash']),
+            'event': name,
+            'request_index': None,
+            'account': None,
+            'role': None,
+            'level': None,
+        }
+        if name in REQUEST_STATES:
+            event['request_index'] = int(topics[1], 16)
+        elif name == 'KYCLevelChanged':
+            event['account'] = _address(topics[1])
+            event['level'] = int(topics[2], 16)
+        elif name in ('RoleGranted', 'RoleRevoked'):
+            event['role'] = topics[1]
+            event['account'] = _address(topics[2])
+        elif name == 'RoleAdminChanged':
+            event['role'] = topics[1]
+        return event
+
+    def _rows(self, query, *params) -> List[dict]:
+        cursor = self._db.execute(query, params)
+        columns = [column[0] for column in cursor.description]
+        return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+
+def _address(topic) -> str:
+    return to_checksum_address('0x' + topic[-40:])
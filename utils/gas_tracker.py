@@ -0,0 +1,112 @@
+import json
+import statistics
+from collections import defaultdict
+from pathlib import Path
+
+import pytest
+from eth_utils import to_checksum_address
+
+from utils import contract_registry
+from utils.transaction_util import add_receipt_listener, remove_receipt_listener
+
+
+class GasTracker:
+    def __init__(self, functions=None):
+        self._functions = functions
+        self.samples = defaultdict(list)
+        self.regressions = []
+        self.improvements = []
+
+    def on_receipt(self, pending, receipt):
+        if receipt['status'] == 1:
+            self.samples[self.operation(pending.to, pending.selector)].append(receipt['gasUsed'])
+
+    def merge(self, samples):
+        for operation, gas in samples.items():
+            self.samples[operation] += gas
+
+    @property
+    def functions(self):
+        if self._functions is None:
+            self._functions = contract_functions()
+        return self._functions
+
+    def operation(self, to, selector):
+        if selector is None:
+            return 'transfer'
+        to = to_checksum_address(to) if to else None
+        return self.functions.get((to, selector), '{}.{}'.format(to, selector))
+
+    def summary(self):
+        return {
+            operation: {'median': int(statistics.median(gas)), 'samples': len(gas)}
+            for operation, gas in sorted(self.samples.items())
+        }
+
+    def compare(self, baseline, tolerance):
+        for operation, current in self.summary().items():
+            if operation not in baseline:
+                continue
+            expected = baseline[operation]['median']
+            change = (current['median'] - expected) / expected if expected else 0.0
+            if change > tolerance:
+                self.regressions.append((operation, expected, current['median'], change))
+            elif change < -tolerance:
+                self.improvements.append((operation, expected, current['median'], change))
+
+
+def contract_functions():
+    return {
+        (artifact.address, selector): '{}.{}'.format(name, function)
+        for name, artifact in contract_registry.artifacts().items()
+        for function, selector in artifact.selectors.items()
+    }
+
+
+_tracker: GasTracker
+
+
+def pytest_configure(config):
+    global _tracker
+    _tracker = GasTracker()
+    add_receipt_listener(_tracker.on_receipt)
+
+
+def pytest_unconfigure(config):
+    remove_receipt_listener(_tracker.on_receipt)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    _tracker.merge(getattr(node, 'workeroutput', {}).get('gas_samples', {}))
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_sessionfinish(session):
+    config = session.config
+    if hasattr(config, 'workerinput'):
+        # the controller merges the samples of all workers and compares them against the baseline
+        config.workeroutput['gas_samples'] = dict(_tracker.samples)
+        return
+    if not _tracker.samples:
+        return
+    path = Path(config.getoption('--gas-baseline'))
+    if config.getoption('--gas-update-baseline'):
+        path.write_text(json.dumps(_tracker.summary(), indent=2))
+        return
+    if path.exists():
+        _tracker.compare(json.loads(path.read_text()), config.getoption('--gas-tolerance'))
+    if _tracker.regressions and config.getoption('--gas-regression') == 'fail':
+        session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+
+def pytest_terminal_summary(terminalreporter):
+    if not _tracker.regressions and not _tracker.improvements:
+        return
+    terminalreporter.write_sep('=', 'gas usage against baseline')
+    for operation, expected, actual, change in _tracker.regressions:
+        terminalreporter.write_line('REGRESSION {}: {} -> {} ({:+.1%})'.format(operation, expected, actual, change),
+                                    red=True)
+    for operation, expected, actual, change in _tracker.improvements:
+        terminalreporter.write_line('improved   {}: {} -> {} ({:+.1%})'.format(operation, expected, actual, change),
+                                    green=True)
@@ -0,0 +1,47 @@
+import json
+from pathlib import Path
+
+from eth_utils import to_canonical_address, to_wei
+from web3 import EthereumTesterProvider
+
+from utils.contract_registry import ARTIFACTS_DIR, CONTRACT_ADDRESSES
+
+FUNDED_BALANCE = to_wei(1_000_000, 'ether')
+
+
+def local_chain_provider(funded_addresses, artifacts_dir=ARTIFACTS_DIR) -> EthereumTesterProvider:
+    try:
+        from eth_tester import EthereumTester, PyEVMBackend
+    except ImportError as error:
+        raise RuntimeError('--backend=local requires eth-tester with py-evm: '
+                           'pip3 install "eth-tester[py-evm]==0.6.0b6"') from error
+
+    genesis_state = {
+        to_canonical_address(address): _account_state(balance=FUNDED_BALANCE)
+        for address in funded_addresses
+    }
+    for name, address in CONTRACT_ADDRESSES.items():
+        genesis_state[to_canonical_address(address)] = _contract_state(Path(artifacts_dir), name)
+    return EthereumTesterProvider(EthereumTester(PyEVMBackend(genesis_state=genesis_state)))
+
+
+def _contract_state(artifacts_dir: Path, name):
+    runtime = artifacts_dir / '{}.bin-runtime'.format(name)
+    if not runtime.exists():
+        raise RuntimeError('--backend=local requires runtime bytecode of {} in {}'.format(name, runtime))
+    code = bytes.fromhex(runtime.read_text().strip().replace('0x', '', 1))
+
+    storage = {}
+    storage_file = artifacts_dir / '{}.storage.json'.format(name)
+    if storage_file.exists():
+        storage = {int(slot, 16): int(value, 16) for slot, value in json.loads(storage_file.read_text()).items()}
+    return _account_state(code=code, storage=storage)
+
+
+def _account_state(balance=0, code=b'', storage=None):
+    return {
+        'balance': balance,
+        'nonce': 0,
+        'code': code,
+        'storage': storage or {},
+    }
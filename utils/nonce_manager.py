@@ -0,0 +1,58 @@
+import threading
+from typing import Dict
+
+from web3 import Web3
+from web3.types import Nonce
+
+NONCE_ERRORS = ('nonce too low', 'replacement transaction underpriced')
+KNOWN_TRANSACTION_ERRORS = ('known transaction', 'already known')
+
+
+class NonceManager:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._next: Dict[str, int] = {}
+
+    def allocate(self, web3: Web3, address: str) -> Nonce:
+        with self._lock:
+            if address not in self._next:
+                self._next[address] = web3.eth.get_transaction_count(address, 'pending')
+            nonce = self._next[address]
+            self._next[address] = nonce + 1
+            return Nonce(nonce)
+
+    def take(self, address: str) -> Nonce:
+        with self._lock:
+            nonce = self._next[address]
+            self._next[address] = nonce + 1
+            return Nonce(nonce)
+
+    def seed(self, address: str, nonce: int):
+        with self._lock:
+            self._next.setdefault(address, nonce)
+
+    def is_synced(self, address: str) -> bool:
+        return address in self._next
+
+    def reset(self, address: str = None):
+        with self._lock:
+            if address is None:
+                self._next.clear()
+            else:
+                self._next.pop(address, None)
+
+
+def is_nonce_error(error: ValueError) -> bool:
+    return _matches(error, NONCE_ERRORS)
+
+
+def is_known_transaction_error(error: ValueError) -> bool:
+    return _matches(error, KNOWN_TRANSACTION_ERRORS)
+
+
+def _matches(error: ValueError, patterns) -> bool:
+    if not error.args:
+        return False
+    details = error.args[0]
+    message = details.get('message', '') if isinstance(details, dict) else str(details)
+    return any(pattern in message.lower() for pattern in patterns)
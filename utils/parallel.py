@@ -0,0 +1,16 @@
+from eth_account.signers.local import LocalAccount
+from web3 import Web3
+
+MASTER = 'master'
+
+
+def worker_name(config) -> str:
+    return getattr(config, 'workerinput', {}).get('workerid', MASTER)
+
+
+def is_parallel_worker(config) -> bool:
+    return worker_name(config) != MASTER
+
+
+def derive_worker_account(web3, base_key: bytes, worker: str) -> LocalAccount:
+    return web3.eth.account.privateKeyToAccount(Web3.keccak(bytes(base_key) + worker.encode()))
@@ -0,0 +1,32 @@
+import fcntl
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+
+
+class ProcessLock:
+    def __init__(self, directory, name):
+        self.path = Path(directory) / '{}.lock'.format(name)
+        self._thread_lock = threading.RLock()
+
+    @contextmanager
+    def shared(self):
+        with self._locked(fcntl.LOCK_SH):
+            yield
+
+    @contextmanager
+    def exclusive(self):
+        with self._locked(fcntl.LOCK_EX):
+            yield
+
+    @contextmanager
+    def _locked(self, operation):
+        with self._thread_lock:
+            fd = os.open(str(self.path), os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                fcntl.flock(fd, operation)
+                yield
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+                os.close(fd)
@@ -0,0 +1,187 @@
+import asyncio
+import itertools
+import json
+import logging
+import threading
+import time
+from concurrent.futures import Future, wait, FIRST_COMPLETED
+from typing import Dict, Callable, List
+
+import websockets
+from web3._utils.method_formatters import receipt_formatter
+from web3.datastructures import AttributeDict
+from web3.exceptions import TimeExhausted
+
+from utils.rpc_batch import send_batch
+from utils.rpc_metrics import record_rpc
+
+logger = logging.getLogger()
+
+
+class PollingReceiptWaiter:
+    def __init__(self, web3, min_interval=0.1, max_interval=1.0, backoff=1.5):
+        self.web3 = web3
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+
+    def wait(self, tx_hashes: List[str], timeout: float, on_receipt: Callable = None) -> Dict[str, AttributeDict]:
+        receipts = {}
+        interval = self.min_interval
+        deadline = time.monotonic() + timeout
+        while True:
+            missing = [tx_hash for tx_hash in tx_hashes if tx_hash not in receipts]
+            responses = send_batch(self.web3, [('eth_getTransactionReceipt', [tx_hash]) for tx_hash in missing])
+            for tx_hash, response in zip(missing, responses):
+                if 'error' in response:
+                    raise ValueError(response['error'])
+                if response.get('result') is None:
+                    continue
+                receipts[tx_hash] = format_receipt(response['result'])
+                if on_receipt:
+                    on_receipt(tx_hash, receipts[tx_hash])
+            if len(receipts) == len(tx_hashes):
+                return receipts
+            _check_deadline(tx_hashes, receipts, deadline, timeout)
+            time.sleep(interval)
+            interval = min(interval * self.backoff, self.max_interval)
+
+
+class NewHeadsReceiptWaiter:
+    def __init__(self, endpoint_uri: str, connect_timeout=10):
+        self.endpoint_uri = endpoint_uri
+        self._ids = itertools.count(1)
+        self._pending: Dict[str, List[Future]] = {}
+        self._pending_lock = threading.Lock()
+        self._responses: Dict[tuple, asyncio.Future] = {}
+        self._socket = None
+        self._loop = asyncio.new_event_loop()
+        self._connected = Future()
+        self._thread = threading.Thread(target=self._run, name='new-heads-receipt-waiter', daemon=True)
+        self._thread.start()
+        self._connected.result(timeout=connect_timeout)
+
+    def wait(self, tx_hashes: List[str], timeout: float, on_receipt: Callable = None) -> Dict[str, AttributeDict]:
+        futures = {tx_hash: Future() for tx_hash in tx_hashes}
+        with self._pending_lock:
+            for tx_hash, future in futures.items():
+                self._pending.setdefault(tx_hash, []).append(future)
+        self._loop.call_soon_threadsafe(self._schedule_lookup)
+
+        receipts = {}
+        deadline = time.monotonic() + timeout
+        remaining = dict(futures)
+        try:
+            while remaining:
+                done, _ = wait(remaining.values(), timeout=max(deadline - time.monotonic(), 0),
+                               return_when=FIRST_COMPLETED)
+                if not done:
+                    _check_deadline(tx_hashes, receipts, deadline, timeout)
+                for tx_hash, future in list(remaining.items()):
+                    if future in done:
+                        receipts[tx_hash] = future.result()
+                        del remaining[tx_hash]
+                        if on_receipt:
+                            on_receipt(tx_hash, receipts[tx_hash])
+            return receipts
+        finally:
+            self._forget(futures)
+
+    def close(self):
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+
+    def _forget(self, futures: Dict[str, Future]):
+        with self._pending_lock:
+            for tx_hash, future in futures.items():
+                waiting = self._pending.get(tx_hash, [])
+                if future in waiting:
+                    waiting.remove(future)
+                if not waiting:
+                    self._pending.pop(tx_hash, None)
+
+    def _run(self):
+        asyncio.set_event_loop(self._loop)
+        self._loop.create_task(self._listen())
+        self._loop.run_forever()
+
+    async def _listen(self):
+        try:
+            async with websockets.connect(self.endpoint_uri, max_size=None) as socket:
+                self._socket = socket
+                reader = self._loop.create_task(self._read())
+                await self._request({'method': 'eth_subscribe', 'params': ['newHeads']})
+                self._connected.set_result(True)
+                await reader
+        except Exception as error:
+            if not self._connected.done():
+                self._connected.set_exception(error)
+            logger.error('newHeads subscription to {} closed: {}'.format(self.endpoint_uri, error))
+
+    async def _read(self):
+        async for message in self._socket:
+            payload = json.loads(message)
+            if isinstance(payload, list):
+                key = tuple(sorted(response['id'] for response in payload))
+                self._resolve_response(key, sorted(payload, key=lambda response: response['id']))
+            elif payload.get('method') == 'eth_subscription':
+                self._schedule_lookup()
+            else:
+                self._resolve_response((payload['id'],), payload)
+
+    def _resolve_response(self, key, payload):
+        future = self._responses.pop(key, None)
+        if future is not None and not future.done():
+            future.set_result(payload)
+
+    async def _request(self, payload):
+        if isinstance(payload, list):
+            for request in payload:
+                request.update(jsonrpc='2.0', id=next(self._ids))
+            key = tuple(request['id'] for request in payload)
+        else:
+            payload.update(jsonrpc='2.0', id=next(self._ids))
+            key = (payload['id'],)
+        future = self._loop.create_future()
+        self._responses[key] = future
+        await self._socket.send(json.dumps(payload))
+        return await future
+
+    def _schedule_lookup(self):
+        self._loop.create_task(self._lookup_receipts())
+
+    async def _lookup_receipts(self):
+        with self._pending_lock:
+            tx_hashes = list(self._pending)
+        if not tx_hashes:
+            return
+        batch = [{'method': 'eth_getTransactionReceipt', 'params': [tx_hash]} for tx_hash in tx_hashes]
+        started = time.perf_counter()
+        responses = await self._request(batch)
+        record_rpc('batch', time.perf_counter() - started)
+        for tx_hash, response in zip(tx_hashes, responses):
+            if 'error' not in response and response.get('result') is None:
+                continue
+            with self._pending_lock:
+                futures = self._pending.pop(tx_hash, [])
+            for future in futures:
+                if future.done():
+                    continue
+                if 'error' in response:
+                    future.set_exception(ValueError(response['error']))
+                else:
+                    future.set_result(format_receipt(response['result']))
+
+
+def format_receipt(receipt) -> AttributeDict:
+    return AttributeDict.recursive(receipt_formatter(receipt))
+
+
+def is_websocket_uri(uri: str) -> bool:
+    return uri.startswith('ws://') or uri.startswith('wss://')
+
+
+def _check_deadline(tx_hashes, receipts, deadline, timeout):
+    if time.monotonic() > deadline:
+        missing = [tx_hash for tx_hash in tx_hashes if tx_hash not in receipts]
+        raise TimeExhausted('Transactions {} are not in the chain after {} seconds'.format(missing, timeout))
@@ -0,0 +1,119 @@
+import asyncio
+import itertools
+import json
+import time
+from typing import Any, Callable, List, Tuple
+
+from eth_utils import to_hex, to_int
+from hexbytes import HexBytes
+from web3 import HTTPProvider, WebsocketProvider, Web3
+from web3._utils.abi import get_abi_output_types, map_abi_data
+from web3._utils.normalizers import BASE_RETURN_NORMALIZERS
+from web3._utils.request import make_post_request
+from web3.contract import ContractFunction
+from web3.exceptions import ContractLogicError
+from web3.middleware import combine_middlewares
+
+from utils.rpc_metrics import record_rpc
+
+_ids = itertools.count(1)
+
+
+class RpcBatch:
+    def __init__(self, web3: Web3, block_identifier='latest'):
+        self.web3 = web3
+        self.block_identifier = block_identifier
+        self._requests: List[Tuple[str, list, Callable[[Any], Any]]] = []
+
+    def __len__(self):
+        return len(self._requests)
+
+    def call(self, function: ContractFunction, transaction=None):
+        call = {key: _hex(value) for key, value in dict(transaction or {}).items()}
+        call['to'] = function.address
+        call['data'] = function._encode_transaction_data()
+        output_types = get_abi_output_types(function.abi)
+        self._add('eth_call', [call, self._block()], lambda result: self._decode(output_types, result))
+
+    def get_balance(self, address, block_identifier=None):
+        block = _hex(block_identifier) if block_identifier is not None else self._block()
+        self._add('eth_getBalance', [address, block], _quantity)
+
+    def request(self, method, params, decoder: Callable[[Any], Any] = None):
+        self._add(method, params, decoder or (lambda result: result))
+
+    def execute(self) -> list:
+        requests, self._requests = self._requests, []
+        responses = send_batch(self.web3, [(method, params) for method, params, _ in requests])
+        return [decoder(_result(response)) for (_, _, decoder), response in zip(requests, responses)]
+
+    def _add(self, method, params, decoder):
+        self._requests.append((method, params, decoder))
+
+    def _block(self):
+        return _hex(self.block_identifier)
+
+    def _decode(self, output_types, result):
+        decoded = self.web3.codec.decode_abi(output_types, HexBytes(result))
+        normalized = map_abi_data(BASE_RETURN_NORMALIZERS, output_types, decoded)
+        return normalized[0] if len(normalized) == 1 else normalized
+
+
+def send_batch(web3: Web3, requests: List[Tuple[str, list]]) -> List[dict]:
+    if not requests:
+        return []
+    provider = web3.provider
+    started = time.perf_counter()
+    if isinstance(provider, (HTTPProvider, WebsocketProvider)):
+        responses = _through_middlewares(web3, requests, _post_batch(provider, requests))
+    else:
+        make_request = provider.request_func(web3, web3.middleware_onion)
+        responses = [make_request(method, params) for method, params in requests]
+    record_rpc('batch', time.perf_counter() - started)
+    return responses
+
+
+def _post_batch(provider, requests: List[Tuple[str, list]]) -> List[dict]:
+    payload = [{'jsonrpc': '2.0', 'id': next(_ids), 'method': method, 'params': params} for method, params in requests]
+    if isinstance(provider, HTTPProvider):
+        raw = make_post_request(provider.endpoint_uri, json.dumps(payload).encode(), **provider.get_request_kwargs())
+        responses = json.loads(raw)
+    else:
+        future = asyncio.run_coroutine_threadsafe(provider.coro_make_request(json.dumps(payload).encode()),
+                                                  WebsocketProvider._loop)
+        responses = future.result()
+    if isinstance(responses, dict):
+        raise ValueError(responses.get('error', responses))
+    by_id = {response['id']: response for response in responses}
+    return [by_id[request['id']] for request in payload]
+
+
+def _through_middlewares(web3: Web3, requests: List[Tuple[str, list]], responses: List[dict]) -> List[dict]:
+    # every request still passes the middleware onion (call cache, metrics, result formatters), whose provider end
+    # answers with the batch's response; a call cache hit therefore returns the cached response of a sent request
+    response = None
+    make_request = combine_middlewares(web3.middleware_onion, web3, lambda method, params: response)
+    results = []
+    for (method, params), response in zip(requests, responses):
+        results.append(make_request(method, params))
+    return results
+
+
+def _quantity(value):
+    return value if isinstance(value, int) else to_int(hexstr=value)
+
+
+def _result(response):
+    if 'error' in response:
+        error = response['error']
+        message = error.get('message', '') if isinstance(error, dict) else str(error)
+        if message.startswith('execution reverted'):
+            raise ContractLogicError(message)
+        raise ValueError(error)
+    return response['result']
+
+
+def _hex(value):
+    if isinstance(value, int) and not isinstance(value, bool):
+        return to_hex(value)
+    return value
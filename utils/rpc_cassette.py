@@ -0,0 +1,171 @@
+import gzip
+import hashlib
+import json
+import re
+import threading
+from collections import defaultdict
+from pathlib import Path
+
+import pytest
+from web3._utils.encoding import Web3JsonEncoder
+from web3.providers import BaseProvider
+
+RECORD = 'record'
+REPLAY = 'replay'
+SESSION = 'session'
+META_FILE = 'meta.json'
+
+
+class CassetteEncoder(Web3JsonEncoder):
+    def default(self, obj):
+        if isinstance(obj, (bytes, bytearray)):
+            return '0x' + bytes(obj).hex()
+        return super().default(obj)
+
+
+class CassetteLibrary:
+    def __init__(self):
+        self.mode = None
+        self.directory = None
+        self.current = SESSION
+        self._interactions = defaultdict(lambda: defaultdict(list))
+        self._positions = defaultdict(int)
+        self._fallback = None
+        self._lock = threading.Lock()
+
+    def configure(self, mode, directory):
+        self.mode = mode
+        self.directory = Path(directory)
+        if mode == RECORD:
+            self.directory.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def active(self) -> bool:
+        return self.mode is not None
+
+    def use(self, name):
+        with self._lock:
+            self.current = name
+            if self.mode == REPLAY and name not in self._interactions:
+                self._interactions[name] = self._read(self._path(name))
+
+    def record(self, method, params, response):
+        with self._lock:
+            self._interactions[self.current][_key(method, params)].append(response)
+
+    def replay(self, method, params):
+        key = _key(method, params)
+        with self._lock:
+            responses = self._interactions[self.current].get(key)
+            if not responses:
+                responses = self._all_cassettes().get(key)
+            if not responses:
+                raise RuntimeError('no recorded response for {} {} in {}'.format(
+                    method, params, self._path(self.current)))
+            position = self._positions[(self.current, key)]
+            self._positions[(self.current, key)] = position + 1
+            return responses[min(position, len(responses) - 1)]
+
+    def save(self, name=None):
+        if self.mode != RECORD:
+            return
+        with self._lock:
+            name = name or self.current
+            interactions = self._interactions.pop(name, None)
+        if interactions:
+            with gzip.open(self._path(name), 'wt') as f:
+                json.dump(interactions, f, separators=(',', ':'), cls=CassetteEncoder)
+
+    def write_meta(self, meta):
+        (self.directory / META_FILE).write_text(json.dumps(meta, indent=2))
+
+    def read_meta(self) -> dict:
+        path = Path(self.directory) / META_FILE
+        return json.loads(path.read_text()) if path.exists() else {}
+
+    def _all_cassettes(self):
+        if self._fallback is None:
+            self._fallback = defaultdict(list)
+            for path in sorted(self.directory.glob('*.json.gz')):
+                for key, responses in self._read(path).items():
+                    self._fallback[key] += responses
+        return self._fallback
+
+    def _path(self, name) -> Path:
+        return self.directory / '{}.json.gz'.format(re.sub(r'[^\w.-]+', '_', name))
+
+    @staticmethod
+    def _read(path: Path):
+        if not path.exists():
+            return {}
+        with gzip.open(path, 'rt') as f:
+            return json.load(f)
+
+
+class CassetteProvider(BaseProvider):
+    def __init__(self, library: CassetteLibrary, provider: BaseProvider = None):
+        self.library = library
+        self.provider = provider
+
+    def make_request(self, method, params):
+        if self.library.mode == REPLAY:
+            return self.library.replay(method, params)
+        response = self.provider.make_request(method, params)
+        self.library.record(method, params, json.loads(json.dumps(response, cls=CassetteEncoder)))
+        return response
+
+    def isConnected(self) -> bool:
+        return self.library.mode == REPLAY or self.provider.isConnected()
+
+
+_library = CassetteLibrary()
+
+
+def cassette_library() -> CassetteLibrary:
+    return _library
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    record, replay = config.getoption('--rpc-record'), config.getoption('--rpc-replay')
+    if record and replay:
+        raise pytest.UsageError('--rpc-record and --rpc-replay are mutually exclusive')
+    if record:
+        _library.configure(RECORD, record)
+    elif replay:
+        _library.configure(REPLAY, replay)
+        mnemonic = _library.read_meta().get('account_mnemonic')
+        if mnemonic and not config.getoption('--account-mnemonic'):
+            config.option.account_mnemonic = mnemonic
+    if _library.active:
+        _library.use(_session_name(config))
+
+
+def pytest_sessionstart(session):
+    if _library.mode == RECORD and not hasattr(session.config, 'workerinput'):
+        _library.write_meta({'account_mnemonic': session.config.account_mnemonic})
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item):
+    if not _library.active:
+        yield
+        return
+    _library.use(item.nodeid)
+    yield
+    _library.save()
+    _library.use(_session_name(item.config))
+
+
+def pytest_sessionfinish(session):
+    _library.save(_session_name(session.config))
+
+
+def _session_name(config) -> str:
+    worker = getattr(config, 'workerinput', {}).get('workerid')
+    return '{}-{}'.format(SESSION, worker) if worker else SESSION
+
+
+def _key(method, params) -> str:
+    canonical = json.dumps([method, params], sort_keys=True, separators=(',', ':'), cls=CassetteEncoder)
+    return hashlib.sha1(canonical.encode()).hexdigest()[:16]
@@ -0,0 +1,126 @@
+import json
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+
+import pytest
+
+SESSION = 'session'
+BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, float('inf'))
+
+
+class Histogram:
+    def __init__(self):
+        self.counts = [0] * len(BUCKETS_MS)
+        self.total = 0.0
+        self.calls = 0
+
+    def add(self, seconds):
+        millis = seconds * 1000
+        self.counts[next(i for i, bound in enumerate(BUCKETS_MS) if millis <= bound)] += 1
+        self.total += seconds
+        self.calls += 1
+
+    def percentile(self, fraction):
+        threshold = fraction * self.calls
+        seen = 0
+        for bound, count in zip(BUCKETS_MS, self.counts):
+            seen += count
+            if count and seen >= threshold:
+                return bound
+        return 0
+
+    def to_dict(self):
+        return {
+            'calls': self.calls,
+            'total_seconds': round(self.total, 6),
+            'buckets_ms': {str(bound): count for bound, count in zip(BUCKETS_MS, self.counts) if count},
+        }
+
+
+class RpcMetrics:
+    def __init__(self):
+        self.current_test = SESSION
+        self.latency = defaultdict(Histogram)
+        self.calls = defaultdict(lambda: defaultdict(int))
+        self.receipt_wait = defaultdict(float)
+        self._lock = threading.Lock()
+
+    def middleware(self, make_request, web3):
+        def rpc_metrics_middleware(method, params):
+            started = time.perf_counter()
+            try:
+                return make_request(method, params)
+            finally:
+                self.record(method, time.perf_counter() - started)
+
+        return rpc_metrics_middleware
+
+    def record(self, method, seconds):
+        with self._lock:
+            self.latency[method].add(seconds)
+            self.calls[self.current_test][method] += 1
+
+    def record_receipt_wait(self, seconds):
+        with self._lock:
+            self.receipt_wait[self.current_test] += seconds
+
+    def to_dict(self):
+        return {
+            'methods': {method: histogram.to_dict() for method, histogram in sorted(self.latency.items())},
+            'tests': {
+                test: {'calls': dict(calls), 'receipt_wait_seconds': round(self.receipt_wait.get(test, 0.0), 6)}
+                for test, calls in self.calls.items()
+            },
+            'receipt_wait_seconds': round(sum(self.receipt_wait.values()), 6),
+        }
+
+
+_metrics = RpcMetrics()
+
+
+def rpc_metrics() -> RpcMetrics:
+    return _metrics
+
+
+def record_rpc(method, seconds):
+    _metrics.record(method, seconds)
+
+
+def record_receipt_wait(seconds):
+    _metrics.record_receipt_wait(seconds)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item):
+    _metrics.current_test = item.nodeid
+    yield
+    _metrics.current_test = SESSION
+
+
+def pytest_terminal_summary(terminalreporter):
+    if not _metrics.latency:
+        return
+    terminalreporter.write_sep('=', 'RPC metrics')
+    terminalreporter.write_line('{:<32} {:>8} {:>10} {:>9} {:>9} {:>9}'.format(
+        'method', 'calls', 'total s', 'mean ms', 'p50 ms', 'p95 ms'))
+    for method, histogram in sorted(_metrics.latency.items(), key=lambda entry: -entry[1].total):
+        terminalreporter.write_line('{:<32} {:>8} {:>10.3f} {:>9.1f} {:>9} {:>9}'.format(
+            method, histogram.calls, histogram.total, histogram.total * 1000 / histogram.calls,
+            histogram.percentile(0.5), histogram.percentile(0.95)))
+    terminalreporter.write_line('waiting for receipts: {:.3f} s'.format(sum(_metrics.receipt_wait.values())))
+
+
+def pytest_sessionfinish(session):
+    if not _metrics.latency:
+        return
+    path = _artifact_path(session.config)
+    path.write_text(json.dumps(_metrics.to_dict(), indent=2))
+
+
+def _artifact_path(config) -> Path:
+    html = config.getoption('htmlpath', None)
+    directory = Path(html).resolve().parent if html else Path.cwd()
+    worker = getattr(config, 'workerinput', {}).get('workerid')
+    return directory / ('rpc-metrics-{}.json'.format(worker) if worker else 'rpc-metrics.json')
@@ -0,0 +1,156 @@
+import json
+import logging
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Optional
+
+from eth_utils import to_hex
+from hexbytes import HexBytes
+from web3 import Web3
+from web3.constants import ADDRESS_ZERO
+
+from contract.bindings import KYCContract
+from utils import contract_registry
+from utils.rpc_batch import send_batch
+
+logger = logging.getLogger()
+
+BATCH_SIZE = 200
+
+
+class StateExporter:
+    def __init__(self, web3: Web3, output, block=None, batch_size=BATCH_SIZE, workers=4):
+        self.web3 = web3
+        self.output = Path(output)
+        self.checkpoint_path = self.output.with_name(self.output.name + '.checkpoint')
+        self.block = block
+        self.batch_size = batch_size
+        self.workers = workers
+        self.address = contract_registry.artifact('KYCContract').address
+        self._users = Counter()
+        self._centres = Counter()
+
+    def run(self) -> int:
+        state = self._load_checkpoint()
+        self.block = state['block']
+        logger.info('EXPORT[block {}, resuming at request {}, address {}]'.format(
+            self.block, state['next_request'], state['addresses_done']))
+        self._restore_counts(state['offset'])
+        with open(self.output, 'ab') as output:
+            output.truncate(state['offset'])
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                if not state['requests_done']:
+                    self._export_requests(executor, output, state)
+                self._export_addresses(executor, output, state)
+        return state['next_request']
+
+    def _export_requests(self, executor, output, state):
+        while not state['requests_done']:
+            indices = list(range(state['next_request'], state['next_request'] + self.batch_size * self.workers))
+            results = self._call_all(executor, [KYCContract.kycRequests(index) for index in indices])
+            for index, result in zip(indices, results):
+                request = KYCContract.decode_kycRequests(result) if result is not None else None
+                if request is None or request[0] == ADDRESS_ZERO:
+                    state['requests_done'] = True
+                    break
+                user, data, level, status, centre, deposit = request
+                self._users[user] += 1
+                self._centres[centre] += 1
+                _write(output, {'type': 'request', 'index': index, 'user': user, 'data': to_hex(data),
+                                'level': level, 'status': status, 'centre': centre, 'deposit': deposit})
+                state['next_request'] = index + 1
+            self._save_checkpoint(output, state)
+
+    def _export_addresses(self, executor, output, state):
+        addresses = sorted(set(self._users) | set(self._centres))
+        while state['addresses_done'] < len(addresses):
+            chunk = addresses[state['addresses_done']:state['addresses_done'] + self.batch_size]
+            calls, layout = [], []
+            for address in chunk:
+                requests = [KYCContract.userKYCRequests(address, i) for i in range(self._users[address])]
+                centre_requests = [KYCContract.kycCentreRequests(address, i) for i in range(self._centres[address])]
+                layout.append((len(requests), len(centre_requests)))
+                calls += [KYCContract.level(address), KYCContract.payments(address)] + requests + centre_requests
+            results = self._call_all(executor, calls)
+            if None in results:
+                raise ValueError('eth_call failed at block {} while exporting {}..{}'.format(
+                    self.block, chunk[0], chunk[-1]))
+            results = iter(results)
+            for address, (user_count, centre_count) in zip(chunk, layout):
+                level = KYCContract.decode_level(next(results))
+                payments = KYCContract.decode_payments(next(results))
+                requests = [KYCContract.decode_userKYCRequests(next(results)) for _ in range(user_count)]
+                centre_requests = [KYCContract.decode_kycCentreRequests(next(results)) for _ in range(centre_count)]
+                _write(output, {'type': 'address', 'address': address, 'level': level, 'payments': payments,
+                                'requests': requests, 'centre_requests': centre_requests})
+            state['addresses_done'] += len(chunk)
+            self._save_checkpoint(output, state)
+
+    def _call_all(self, executor, calls) -> List[Optional[bytes]]:
+        block = to_hex(self.block)
+        batches = [
+            [('eth_call', [{'to': self.address, 'data': data}, block]) for data in calls[i:i + self.batch_size]]
+            for i in range(0, len(calls), self.batch_size)
+        ]
+        results = []
+        for responses in executor.map(lambda batch: send_batch(self.web3, batch), batches):
+            results += [_call_result(response) for response in responses]
+        return results
+
+    def _load_checkpoint(self) -> dict:
+        if self.checkpoint_path.exists():
+            state = json.loads(self.checkpoint_path.read_text())
+            if self.block is not None and self.block != state['block']:
+                raise ValueError('checkpoint {} is pinned to block {}, not {}'.format(
+                    self.checkpoint_path, state['block'], self.block))
+            return state
+        return {
+            'block': self.block if self.block is not None else self.web3.eth.block_number,
+            'offset': 0,
+            'next_request': 0,
+            'requests_done': False,
+            'addresses_done': 0,
+        }
+
+    def _save_checkpoint(self, output, state):
+        output.flush()
+        state['offset'] = output.tell()
+        partial = self.checkpoint_path.with_suffix('.tmp')
+        partial.write_text(json.dumps(state))
+        partial.replace(self.checkpoint_path)
+
+    def _restore_counts(self, offset):
+        if not self.output.exists():
+            return
+        with open(self.output, 'rb') as output:
+            for line in output.read(offset).splitlines():
+                record = json.loads(line)
+                if record['type'] == 'request':
+                    self._users[record['user']] += 1
+                    self._centres[record['centre']] += 1
+
+
+def to_parquet(jsonl_path, parquet_path):
+    try:
+        import pyarrow.json
+        import pyarrow.parquet
+    except ImportError as error:
+        raise RuntimeError('Parquet export requires pyarrow: pip3 install pyarrow') from error
+
+    table = pyarrow.json.read_json(str(jsonl_path))
+    pyarrow.parquet.write_table(table, str(parquet_path))
+
+
+def _call_result(response) -> Optional[bytes]:
+    if 'error' not in response:
+        return HexBytes(response['result'])
+    error = response['error']
+    message = error.get('message', '') if isinstance(error, dict) else str(error)
+    if message.startswith('execution reverted'):
+        return None
+    raise ValueError('eth_call failed: {}'.format(error))
+
+
+def _write(output, record):
+    output.write(json.dumps(record).encode() + b'\n')
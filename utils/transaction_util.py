@@ -1,22 +1,259 @@
+import time
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass, field
+from typing import List, Iterable, Callable, Optional, Tuple, Dict
+from weakref import WeakKeyDictionary
+
 from eth_account.signers.local import LocalAccount
+from eth_utils import to_hex
 from web3 import Web3
-from web3.types import TxParams, Nonce
+from web3._utils.events import get_event_data
+from web3.contract import ContractFunction
+from web3.exceptions import ContractLogicError
+from web3.types import TxParams, Nonce, TxReceipt, EventData
 
+from utils import contract_registry
+from utils.bulk_signer import sign_transactions
+from utils.nonce_manager import NonceManager, is_nonce_error, is_known_transaction_error
+from utils.receipt_waiter import PollingReceiptWaiter
+from utils.rpc_batch import RpcBatch
+from utils.rpc_metrics import record_receipt_wait
 
-def send_transaction(web3: Web3, transaction: TxParams, sender: LocalAccount):
-    transaction['nonce'] = _nonce(web3, sender)
+NONCE_RETRIES = 3
+RECEIPT_TIMEOUT = 120
+
+_nonce_manager = NonceManager()
+_receipt_listeners: List[Callable] = []
+_receipt_waiters = WeakKeyDictionary()
+_shared_senders = {}
+
+
+@dataclass
+class PendingTransaction:
+    tx_hash: str
+    sender: str
+    nonce: int
+    to: Optional[str] = None
+    selector: Optional[str] = None
+    submitted_at: float = field(default_factory=time.monotonic)
+
+
+@dataclass
+class TransactionResult:
+    tx_hash: str
+    receipt: TxReceipt
+    effective_gas_price: int
+    events: List[EventData]
+    balances_before: Dict[str, int]
+    balances_after: Dict[str, int]
+    call_results: list
+
+    @property
+    def fee(self) -> int:
+        return self.receipt['gasUsed'] * self.effective_gas_price
+
+    def balance_change(self, address) -> int:
+        return self.balances_after[address] - self.balances_before[address]
+
+    def event_names(self) -> List[str]:
+        return [event['event'] for event in self.events]
+
+
+def send_transaction(web3: Web3, transaction: TxParams, sender: LocalAccount, details=False,
+                     balances: Iterable[str] = None, calls: Iterable[ContractFunction] = ()):
+    pending = submit_transaction(web3, transaction, sender)
+    receipt = wait_all(web3, [pending])[0]
+    if not details:
+        return pending.tx_hash
+    return transaction_result(web3, transaction, receipt, balances or [sender.address], calls)
+
+
+def transaction_result(web3: Web3, transaction: TxParams, receipt: TxReceipt, balances: Iterable[str],
+                       calls: Iterable[ContractFunction] = ()) -> TransactionResult:
+    balances = list(balances)
+    block = receipt['blockNumber']
+    batch = RpcBatch(web3, block)
+    for address in balances:
+        batch.get_balance(address, block - 1)
+    for address in balances:
+        batch.get_balance(address)
+    for function in calls:
+        batch.call(function)
+    results = batch.execute()
+    return TransactionResult(
+        tx_hash=to_hex(receipt['transactionHash']),
+        receipt=receipt,
+        effective_gas_price=receipt.get('effectiveGasPrice', transaction['gasPrice']),
+        events=decode_events(web3, receipt['logs']),
+        balances_before=dict(zip(balances, results[:len(balances)])),
+        balances_after=dict(zip(balances, results[len(balances):2 * len(balances)])),
+        call_results=results[2 * len(balances):],
+    )
+
+
+def decode_events(web3: Web3, logs) -> List[EventData]:
+    abis = contract_registry.event_abis()
+    events = []
+    for log in logs:
+        abi = abis.get(to_hex(log['topics'][0])) if log['topics'] else None
+        if abi is not None:
+            events.append(get_event_data(web3.codec, abi, log))
+    return events
+
+
+def submit_transaction(web3: Web3, transaction: TxParams, sender: LocalAccount) -> PendingTransaction:
+    _fill_defaults(web3, transaction)
+    with _shared_nonces([sender]):
+        tx_hash = _send_signed(web3, transaction, sender)
+    return _pending(tx_hash, transaction, sender)
+
+
+def transact(web3: Web3, to: str, data: str, sender: LocalAccount, value=0) -> TxReceipt:
+    tx = {
+        'from': sender.address,
+        'to': to,
+        'data': data,
+        'value': value
+    }
+    receipt = wait_all(web3, [submit_transaction(web3, tx, sender)])[0]
+    if receipt['status'] != 1:
+        raise ContractLogicError('execution reverted: {} in {}'.format(data[:10], receipt['transactionHash'].hex()))
+    return receipt
+
+
+def call(web3: Web3, to: str, data: str, address: str = None) -> bytes:
+    tx = {
+        'to': to,
+        'data': data
+    }
+    if address is not None:
+        tx['from'] = address
+    return web3.eth.call(tx)
+
+
+def submit_transactions(web3: Web3, pairs: List[Tuple[TxParams, LocalAccount]],
+                        processes=None) -> List[PendingTransaction]:
+    for transaction, sender in pairs:
+        _fill_defaults(web3, transaction)
+    pending = []
+    with _shared_nonces([sender for _, sender in pairs]):
+        for transaction, sender in pairs:
+            transaction['nonce'] = _nonce(web3, sender)
+        for (transaction, sender), signed in zip(pairs, sign_transactions(pairs, processes)):
+            try:
+                web3.eth.send_raw_transaction(signed.raw_transaction)
+            except ValueError as error:
+                if not is_known_transaction_error(error):
+                    for _, other in pairs:
+                        _nonce_manager.reset(other.address)
+                    raise
+            pending.append(_pending(signed.tx_hash, transaction, sender))
+    return pending
+
+
+def wait_all(web3: Web3, pending: Iterable[Optional[PendingTransaction]], timeout=RECEIPT_TIMEOUT,
+             on_receipt: Callable[[PendingTransaction, TxReceipt], None] = None) -> List[Optional[TxReceipt]]:
+    pending = list(pending)
+    submitted = {tx.tx_hash: tx for tx in pending if tx is not None}
+    if not submitted:
+        return [None for _ in pending]
+
+    def notify(tx_hash, receipt):
+        _notify_receipt(submitted[tx_hash], receipt)
+        if on_receipt is not None:
+            on_receipt(submitted[tx_hash], receipt)
+
+    started = time.perf_counter()
+    receipts = _receipt_waiter_for(web3).wait(list(submitted), timeout, notify)
+    record_receipt_wait(time.perf_counter() - started)
+    return [receipts[tx.tx_hash] if tx is not None else None for tx in pending]
+
+
+def use_receipt_waiter(web3: Web3, waiter):
+    previous = _receipt_waiters.pop(web3, None)
+    if waiter is not None:
+        _receipt_waiters[web3] = waiter
+    return previous
+
+
+def _receipt_waiter_for(web3: Web3):
+    # every web3 polls through its own provider unless a waiter was installed for it
+    waiter = _receipt_waiters.get(web3)
+    if waiter is None:
+        waiter = _receipt_waiters.setdefault(web3, PollingReceiptWaiter(web3))
+    return waiter
+
+
+def add_receipt_listener(listener: Callable[[PendingTransaction, TxReceipt], None]):
+    _receipt_listeners.append(listener)
+
+
+def remove_receipt_listener(listener: Callable[[PendingTransaction, TxReceipt], None]):
+    if listener in _receipt_listeners:
+        _receipt_listeners.remove(listener)
+
+
+def _notify_receipt(pending: PendingTransaction, receipt: TxReceipt):
+    for listener in list(_receipt_listeners):
+        listener(pending, receipt)
+
+
+def _fill_defaults(web3: Web3, transaction: TxParams):
     transaction['gas'] = 300_000
     transaction['gasPrice'] = web3.eth.gas_price
     transaction['chainId'] = web3.eth.chain_id
+
+
+def _pending(tx_hash, transaction: TxParams, sender: LocalAccount) -> PendingTransaction:
+    return PendingTransaction(tx_hash, sender.address, transaction['nonce'], transaction.get('to'),
+                              function_selector(transaction))
+
+
+def _send_signed(web3: Web3, transaction: TxParams, sender: LocalAccount, retries=NONCE_RETRIES):
+    transaction['nonce'] = _nonce(web3, sender)
     signed_tx = web3.eth.account.sign_transaction(transaction, sender.privateKey)
-    web3.eth.send_raw_transaction(signed_tx.rawTransaction)
     tx_hash = signed_tx['hash'].hex()
-    web3.eth.wait_for_transaction_receipt(tx_hash, poll_latency=1.0)
+    try:
+        web3.eth.send_raw_transaction(signed_tx.rawTransaction)
+    except ValueError as error:
+        _nonce_manager.reset(sender.address)
+        if is_known_transaction_error(error):
+            return tx_hash
+        if is_nonce_error(error) and retries > 0:
+            return _send_signed(web3, transaction, sender, retries - 1)
+        raise
     return tx_hash
 
 
 def _nonce(web3: Web3, sender: LocalAccount) -> Nonce:
-    return web3.eth.get_transaction_count(sender.address)
+    return _nonce_manager.allocate(web3, sender.address)
+
+
+def function_selector(transaction: TxParams) -> Optional[str]:
+    data = transaction.get('data')
+    if not data:
+        return None
+    if isinstance(data, (bytes, bytearray)):
+        data = '0x' + bytes(data).hex()
+    return data[:10].lower() if len(data) >= 10 else None
+
+
+def reset_nonces(address: str = None):
+    _nonce_manager.reset(address)
+
+
+def share_sender(address: str, lock):
+    _shared_senders[address] = lock
+
+
+@contextmanager
+def _shared_nonces(senders: Iterable[LocalAccount]):
+    # other processes sign with a shared sender too: its nonce is read from the node and used under their common lock
+    with ExitStack() as stack:
+        for address in sorted({sender.address for sender in senders} & set(_shared_senders)):
+            stack.enter_context(_shared_senders[address].exclusive())
+            _nonce_manager.reset(address)
+        yield
 
 
 def error_message(error):
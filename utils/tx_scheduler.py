@@ -0,0 +1,74 @@
+import logging
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional
+
+from web3 import Web3
+from web3.exceptions import ContractLogicError
+from web3.types import TxReceipt
+
+from utils.transaction_util import PendingTransaction, wait_all, RECEIPT_TIMEOUT
+
+logger = logging.getLogger()
+
+
+@dataclass(eq=False)
+class Step:
+    submit: Callable[..., Optional[PendingTransaction]]
+    parents: List['Step']
+    name: str
+    children: List['Step'] = field(default_factory=list)
+    pending: Optional[PendingTransaction] = None
+    receipt: Optional[TxReceipt] = None
+    done: bool = False
+
+
+class TxScheduler:
+    def __init__(self, web3: Web3, timeout=RECEIPT_TIMEOUT):
+        self.web3 = web3
+        self.timeout = timeout
+        self._steps: List[Step] = []
+
+    def __len__(self):
+        return len(self._steps)
+
+    def add(self, submit: Callable[..., Optional[PendingTransaction]], after=(), name=None) -> Step:
+        step = Step(submit, list(after), name or getattr(submit, '__name__', 'step'))
+        for parent in step.parents:
+            parent.children.append(step)
+        self._steps.append(step)
+        return step
+
+    def run(self) -> List[Optional[TxReceipt]]:
+        steps, self._steps = self._steps, []
+        in_flight = {}
+        rounds = 0
+
+        def release(step):
+            # parents that had nothing to send (e.g. a role that is already granted) only order their children
+            step.pending = step.submit(*[parent.receipt for parent in step.parents if parent.receipt is not None])
+            if step.pending is None:
+                complete(step, None)
+            else:
+                in_flight[step.pending.tx_hash] = step
+
+        def complete(step, receipt):
+            step.receipt = receipt
+            step.done = True
+            if receipt is not None and receipt['status'] != 1:
+                raise ContractLogicError('{} reverted in {}'.format(step.name, receipt['transactionHash'].hex()))
+            for child in step.children:
+                if not child.done and child.pending is None and all(parent.done for parent in child.parents):
+                    release(child)
+
+        def on_receipt(pending, receipt):
+            complete(in_flight.pop(pending.tx_hash), receipt)
+
+        for step in steps:
+            if not step.parents:
+                release(step)
+        while in_flight:
+            rounds += 1
+            wait_all(self.web3, [step.pending for step in list(in_flight.values())], self.timeout, on_receipt)
+        logger.debug('TX SCHEDULER[{} transactions in {} rounds]'.format(
+            sum(step.pending is not None for step in steps), rounds))
+        return [step.receipt for step in steps]